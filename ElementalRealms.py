@@ -1,39 +1,93 @@
 from dataclasses import dataclass, field
-from typing import List, Dict, Optional
+from typing import List, Dict, Deque, NamedTuple, Optional, Tuple, Union
+from collections import deque
+from array import array
+from itertools import chain, product
+from operator import attrgetter
+from types import MappingProxyType
 import random
+import re
+import sys
 import time
-from enum import Enum
-import threading
+from enum import Enum, IntEnum
 from colorama import init, Fore, Back, Style
 
 # Initialize Colorama
 init(autoreset=True)
 
+# One random stream for the whole game; seed it via set_seed() to replay a session.
+RNG = random.Random()
+
+def set_seed(seed: int) -> None:
+    RNG.seed(seed)
+
+# --- Buffered Output ---
+# Game text is queued with say() and written in a single call just before the
+# game blocks on player input (or exits), rather than one print() per line.
+_output: List[str] = []
+
+def say(text: str) -> None:
+    _output.append(text)
+
+def flush_output() -> None:
+    if _output:
+        # Reset after every line to match Colorama's per-print autoreset.
+        sys.stdout.write((Style.RESET_ALL + "\n").join(_output) + Style.RESET_ALL + "\n")
+        _output.clear()
+
+def prompt(text: str) -> str:
+    flush_output()
+    return input(text)
+
 # --- Extended Enums and Constants ---
-class Element(Enum):
-    FIRE = "Fire"
-    WATER = "Water"
-    EARTH = "Earth"
-    AIR = "Air"
-    LIGHT = "Light"
-    DARK = "Dark"
-    NATURE = "Nature"
-    LIGHTNING = "Lightning"
-    ICE = "Ice"
-    POISON = "Poison"
-
-class Alignment(Enum):
-    LAWFUL_GOOD = "Lawful Good"
-    NEUTRAL_GOOD = "Neutral Good"
-    CHAOTIC_GOOD = "Chaotic Good"
-    LAWFUL_NEUTRAL = "Lawful Neutral"
-    TRUE_NEUTRAL = "True Neutral"
-    CHAOTIC_NEUTRAL = "Chaotic Neutral"
-    LAWFUL_EVIL = "Lawful Evil"
-    NEUTRAL_EVIL = "Neutral Evil"
-    CHAOTIC_EVIL = "Chaotic Evil"
-
-class RelationshipLevel(Enum):
+class LabeledIntEnum(IntEnum):
+    """IntEnum whose members also carry a display label, declared as MEMBER = value, "Label"."""
+    def __new__(cls, value: int, label: str):
+        member = int.__new__(cls, value)
+        member._value_ = value
+        member.label = label
+        return member
+
+class Element(LabeledIntEnum):
+    FIRE = 0, "Fire"
+    WATER = 1, "Water"
+    EARTH = 2, "Earth"
+    AIR = 3, "Air"
+    LIGHT = 4, "Light"
+    DARK = 5, "Dark"
+    NATURE = 6, "Nature"
+    LIGHTNING = 7, "Lightning"
+    ICE = 8, "Ice"
+    POISON = 9, "Poison"
+
+class Alignment(LabeledIntEnum):
+    LAWFUL_GOOD = 0, "Lawful Good"
+    NEUTRAL_GOOD = 1, "Neutral Good"
+    CHAOTIC_GOOD = 2, "Chaotic Good"
+    LAWFUL_NEUTRAL = 3, "Lawful Neutral"
+    TRUE_NEUTRAL = 4, "True Neutral"
+    CHAOTIC_NEUTRAL = 5, "Chaotic Neutral"
+    LAWFUL_EVIL = 6, "Lawful Evil"
+    NEUTRAL_EVIL = 7, "Neutral Evil"
+    CHAOTIC_EVIL = 8, "Chaotic Evil"
+
+class Mob(LabeledIntEnum):
+    SLIME = 0, "Slime"
+    GOBLIN = 1, "Goblin"
+    SHADOW_BEAST = 2, "Shadow Beast"
+    RAT = 3, "Rat"
+    SPIDER = 4, "Spider"
+    SKELETON = 5, "Skeleton"
+    DARK_MAGE = 6, "Dark Mage"
+    STONE_GOLEM = 7, "Stone Golem"
+    HARPY = 8, "Harpy"
+    WEREWOLF = 9, "Werewolf"
+    DRAGON_WYRMLING = 10, "Dragon Wyrmling"
+    LICH = 11, "Lich"
+    ANCIENT_GUARDIAN = 12, "Ancient Guardian"
+    DEMON_LORD = 13, "Demon Lord"
+
+class RelationshipLevel(IntEnum):
     HATED = -2
     DISLIKED = -1
     NEUTRAL = 0
@@ -51,28 +105,89 @@ class QuestRank(Enum):
     SS = 8
     SSS = 9
 
+# Enum members as constant sequences, for RNG.choice and friends.
+ELEMENTS = tuple(Element)
+ALIGNMENTS = tuple(Alignment)
+
+# Step tables for rank-ups and relationship changes. Relationship levels stop
+# at HATED/LOVED; SSS has no next rank.
+_RANKS = tuple(QuestRank)
+_NEXT_RANK = dict(zip(_RANKS, _RANKS[1:]))
+_REL_LEVELS = tuple(RelationshipLevel)
+_NEXT_REL = dict(zip(_REL_LEVELS, _REL_LEVELS[1:] + _REL_LEVELS[-1:]))
+_PREV_REL = dict(zip(_REL_LEVELS, _REL_LEVELS[:1] + _REL_LEVELS[:-1]))
+
+# Case-insensitive lookups and option lists for character creation.
+ELEMENT_LOOKUP = {e.label.lower(): e for e in ELEMENTS}
+ALIGNMENT_LOOKUP = {a.label.lower(): a for a in ALIGNMENTS}
+MOB_LOOKUP = {m.label: m for m in Mob}
+ELEMENT_CHOICES = ", ".join(e.label for e in ELEMENTS)
+ALIGNMENT_CHOICES = ", ".join(a.label for a in ALIGNMENTS)
+
 # Basic elemental advantages – adjust as needed.
 ADVANTAGES = {
-    Element.FIRE.value: [Element.ICE.value, Element.POISON.value, Element.NATURE.value],
-    Element.WATER.value: [Element.FIRE.value, Element.LIGHTNING.value],
-    Element.EARTH.value: [Element.LIGHTNING.value, Element.POISON.value],
-    Element.AIR.value: [Element.EARTH.value, Element.NATURE.value],
-    Element.LIGHT.value: [Element.DARK.value],
-    Element.DARK.value: [Element.LIGHT.value, Element.ICE.value],
-    Element.NATURE.value: [Element.WATER.value, Element.EARTH.value],
-    Element.LIGHTNING.value: [Element.AIR.value, Element.FIRE.value],
-    Element.ICE.value: [Element.LIGHTNING.value, Element.DARK.value],
-    Element.POISON.value: [Element.NATURE.value, Element.EARTH.value]
+    Element.FIRE: [Element.ICE, Element.POISON, Element.NATURE],
+    Element.WATER: [Element.FIRE, Element.LIGHTNING],
+    Element.EARTH: [Element.LIGHTNING, Element.POISON],
+    Element.AIR: [Element.EARTH, Element.NATURE],
+    Element.LIGHT: [Element.DARK],
+    Element.DARK: [Element.LIGHT, Element.ICE],
+    Element.NATURE: [Element.WATER, Element.EARTH],
+    Element.LIGHTNING: [Element.AIR, Element.FIRE],
+    Element.ICE: [Element.LIGHTNING, Element.DARK],
+    Element.POISON: [Element.NATURE, Element.EARTH]
 }
 
+# Attack verb used in the combat log, indexed by the attacker's element.
+ACTION_PHRASES = (
+    "ignites",         # FIRE
+    "soaks",           # WATER
+    "smashes",         # EARTH
+    "slices through",  # AIR
+    "blazes upon",     # LIGHT
+    "shrouds",         # DARK
+    "entangles",       # NATURE
+    "electrocutes",    # LIGHTNING
+    "freezes",         # ICE
+    "corrodes",        # POISON
+)
+
+# --- Status Effects ---
+# Each status is one bit of Character.status_mask; its remaining turns and its
+# per-turn magnitude (damage, or buff percentage) sit at the bit's index in
+# Character.status_turns / Character.status_power.
+STATUS_NAMES = ("Burn", "Poisoned", "Shocked", "Bleed", "Frozen", "Stunned", "Cursed",
+                "Empowered", "Attack Boost", "Defense Boost", "Magic Boost")
+(BURN, POISONED, SHOCKED, BLEED, FROZEN, STUNNED, CURSED,
+ EMPOWERED, ATTACK_BOOST, DEFENSE_BOOST, MAGIC_BOOST) = (1 << i for i in range(len(STATUS_NAMES)))
+STATUS_FLAGS = {name: 1 << i for i, name in enumerate(STATUS_NAMES)}
+DAMAGE_OVER_TIME = BURN | POISONED | SHOCKED | BLEED
+CANNOT_ACT = FROZEN | STUNNED
+
+# Only the most recent relationship events are kept; older ones are dropped.
+RELATIONSHIP_HISTORY_LEN = 16
+
 # --- Core Data Structures ---
-@dataclass
+@dataclass(slots=True)
 class Relationship:
     level: RelationshipLevel = RelationshipLevel.NEUTRAL
     progress: int = 0
-    history: List[str] = field(default_factory=list)
+    history: Deque[str] = field(default_factory=lambda: deque(maxlen=RELATIONSHIP_HISTORY_LEN))
+
+# Shared stand-in for NPCs the player hasn't met yet; read it, never modify it.
+_EMPTY_RELATIONSHIP = Relationship()
 
-@dataclass
+class Personality(NamedTuple):
+    bravery: int
+    loyalty: int
+    greed: int
+
+class QuestInterest(NamedTuple):
+    combat: int
+    exploration: int
+    social: int
+
+@dataclass(slots=True)
 class Item:
     name: str
     attack: int = 0
@@ -81,11 +196,18 @@ class Item:
     value: int = 0
     effect: Optional[str] = None  # e.g., "Bleed", "Stun", "Burn", "Freeze", "Curse"
     effect_chance: float = 0.0    # Chance (in decimal) to trigger the effect
+    # Items are never modified after creation, so the display text is built once.
+    _str_cache: Optional[str] = field(default=None, init=False, repr=False, compare=False)
 
     def __post_init__(self):
-        self.value = (self.attack + self.defense + self.magic) * 10 + random.randint(10, 50)
+        self.value = (self.attack + self.defense + self.magic) * 10 + RNG.randint(10, 50)
 
     def __str__(self):
+        if self._str_cache is None:
+            self._str_cache = self._render()
+        return self._str_cache
+
+    def _render(self) -> str:
         stats = []
         if self.attack > 0: 
             stats.append(f"ATK +{self.attack}")
@@ -99,6 +221,8 @@ class Item:
         return f"{self.name} ({', '.join(stats)}{extra})"
 
 class Consumable(Item):
+    __slots__ = ('heal_value', 'throw_damage', 'duration', 'buff_effect', 'effect_percentage')
+
     def __init__(self, name: str, heal_value: int = 0, throw_damage: int = 0, duration: int = 0, effect: Optional[str] = None, effect_percentage: int = 0):
         super().__init__(name)
         self.heal_value = heal_value
@@ -107,7 +231,7 @@ class Consumable(Item):
         self.buff_effect = effect       # e.g., "Attack Boost"
         self.effect_percentage = effect_percentage
 
-    def __str__(self):
+    def _render(self) -> str:
         if self.heal_value > 0:
             return f"{self.name} (Heals {self.heal_value} HP)"
         elif self.throw_damage > 0:
@@ -118,21 +242,36 @@ class Consumable(Item):
             return self.name
 
 # Helper: determine equipment slot from item name.
+_SLOT_MAP = {
+    "sword": "weapon", "wand": "weapon", "tome": "weapon", "axe": "weapon", "bow": "weapon", "dagger": "weapon",
+    "armor": "armor", "robe": "armor",
+    "shield": "shield",
+    "ring": "accessory", "amulet": "accessory",
+}
+_SLOT_RE = re.compile("|".join(_SLOT_MAP))
+
 def determine_slot(item: Item) -> Optional[str]:
-    name = item.name.lower()
-    if any(x in name for x in ["sword", "wand", "tome", "axe", "bow", "dagger"]):
-        return "weapon"
-    elif "armor" in name or "robe" in name:
-        return "armor"
-    elif "shield" in name:
-        return "shield"
-    elif any(x in name for x in ["ring", "amulet"]):
-        return "accessory"
-    return None
+    m = _SLOT_RE.search(item.name.lower())
+    return _SLOT_MAP[m.group()] if m else None
 
 # --- Base Character Classes ---
 class Character:
+    __slots__ = ('name', 'health', 'max_health', 'attack', 'defense', 'magic_power',
+                 'element', 'alignment', 'inventory', 'gold', 'exp', 'level',
+                 'relationships', '_personality', 'alive',
+                 'status_mask', 'status_turns', 'status_power')
+    # Only the player's relationship history is ever shown, so NPCs skip recording it.
+    RECORDS_HISTORY = False
+
     def __init__(self, name: str, health: int, attack: int, defense: int, magic: int, element: Element, alignment: Alignment):
+        self.inventory: List[Item] = []
+        self.relationships: Dict[str, Relationship] = {}
+        self.status_turns = array('i', [0] * len(STATUS_NAMES))
+        self.status_power = array('i', [0] * len(STATUS_NAMES))
+        self._reset(name, health, attack, defense, magic, element, alignment)
+
+    def _reset(self, name: str, health: int, attack: int, defense: int, magic: int, element: Element, alignment: Alignment):
+        # Put the character in its freshly-created state, reusing the existing containers.
         self.name = name
         self.health = health
         self.max_health = health
@@ -141,65 +280,97 @@ class Character:
         self.magic_power = magic
         self.element = element
         self.alignment = alignment
-        self.inventory: List[Item] = []
+        self.inventory.clear()
         self.gold: int = 0
         self.exp: int = 0
         self.level: int = 1
-        self.relationships: Dict[str, Relationship] = {}
-        self.personality: Dict[str, int] = {
-            'bravery': random.randint(1, 10),
-            'loyalty': random.randint(1, 10),
-            'greed': random.randint(1, 10)
-        }
+        self.relationships.clear()
+        self._personality: Optional[Personality] = None
         self.alive: bool = True
-        self.status_effects: Dict[str, Dict] = {}
+        self.status_mask: int = 0
+
+    def die(self):
+        self.alive = False
+
+    @property
+    def personality(self) -> Personality:
+        # Rolled on first use; most enemies never need one.
+        if self._personality is None:
+            _randint = RNG.randint
+            self._personality = Personality(_randint(1, 10), _randint(1, 10), _randint(1, 10))
+        return self._personality
 
     def update_relationship(self, other: 'Character', change: int, reason: str):
         if other.name not in self.relationships:
             self.relationships[other.name] = Relationship()
         rel = self.relationships[other.name]
         rel.progress += change
-        rel.history.append(f"{reason} ({'+' if change > 0 else ''}{change})")
+        if self.RECORDS_HISTORY:
+            rel.history.append(f"{reason} ({'+' if change > 0 else ''}{change})")
         if rel.progress >= 100:
-            rel.level = RelationshipLevel(rel.level.value + 1)
+            rel.level = _NEXT_REL[rel.level]
             rel.progress = 0
         elif rel.progress <= -100:
-            rel.level = RelationshipLevel(rel.level.value - 1)
+            rel.level = _PREV_REL[rel.level]
             rel.progress = 0
 
+    def apply_status(self, flag: int, turns: int, power: int = 0):
+        i = flag.bit_length() - 1
+        self.status_mask |= flag
+        self.status_turns[i] = turns
+        self.status_power[i] = power
+
     def process_status_effects(self):
-        for effect_name in list(self.status_effects.keys()):
-            effect = self.status_effects[effect_name]
-            if effect_name in ["Burn", "Poisoned", "Shocked", "Bleed"]:
-                self.health -= effect.get("damage_per_turn", 0)
-                print(Fore.RED + f"{self.name} suffers {effect.get('damage_per_turn', 0)} damage from {effect_name} (turns left: {effect['turns']-1}).")
-            effect["turns"] -= 1
-            if effect["turns"] <= 0:
-                print(Fore.YELLOW + f"{self.name} is no longer affected by {effect_name}.")
-                del self.status_effects[effect_name]
+        mask = self.status_mask
+        if not mask:
+            return
+        turns = self.status_turns
+        for i, effect_name in enumerate(STATUS_NAMES):
+            flag = 1 << i
+            if not mask & flag:
+                continue
+            if flag & DAMAGE_OVER_TIME:
+                damage = self.status_power[i]
+                self.health -= damage
+                say(Fore.RED + f"{self.name} suffers {damage} damage from {effect_name} (turns left: {turns[i]-1}).")
+            turns[i] -= 1
+            if turns[i] <= 0:
+                say(Fore.YELLOW + f"{self.name} is no longer affected by {effect_name}.")
+                mask &= ~flag
+        self.status_mask = mask
 
 class Player(Character):
-    RANK_THRESHOLDS = {
-        QuestRank.F: 100,
-        QuestRank.E: 250,
-        QuestRank.D: 500,
-        QuestRank.C: 1000,
-        QuestRank.B: 2000,
-        QuestRank.A: 4000,
-        QuestRank.S: 8000,
-        QuestRank.SS: 16000,
-        QuestRank.SSS: 32000
+    __slots__ = ('char_class', 'party', 'completed_quests', 'base_health', 'base_attack',
+                 'base_defense', 'base_magic', 'equipment', 'current_rank', 'rank_progress',
+                 'rank_threshold', 'revives', 'live_party', '_roster')
+    RECORDS_HISTORY = True
+
+    BASE_STATS = {
+        'Warrior': (120, 15, 10, 5),
+        'Mage': (80, 5, 5, 20),
+        'Rogue': (90, 10, 8, 12)
+    }
+    # (health, attack, defense, magic) gained per level.
+    LEVEL_GAINS = {
+        'Warrior': (15, 3, 2, 1),
+        'Mage': (8, 1, 1, 4),
+        'Rogue': (10, 2, 2, 2)
     }
 
+    # Indexed by QuestRank.value (F=1 .. SSS=9); slot 0 is unused.
+    RANK_THRESHOLDS = (0, 100, 250, 500, 1000, 2000, 4000, 8000, 16000, 32000)
+
+    # EXP needed to advance from each level, indexed by level (slot 0 unused).
+    # Levels past the table use the same formula directly.
+    REQUIRED_EXP = tuple(100 + (level - 1) * 20 for level in range(201))
+
     def __init__(self, name: str, char_class: str, element: Element, alignment: Alignment):
-        base_stats = {
-            'Warrior': (120, 15, 10, 5),
-            'Mage': (80, 5, 5, 20),
-            'Rogue': (90, 10, 8, 12)
-        }
-        super().__init__(name, *base_stats.get(char_class, base_stats['Warrior']), element, alignment)
+        super().__init__(name, *self.BASE_STATS.get(char_class, self.BASE_STATS['Warrior']), element, alignment)
         self.char_class = char_class
         self.party: List['NPC'] = []
+        # Members of party still alive; NPC.die() drops them as they fall.
+        self.live_party: List['NPC'] = []
+        self._roster: Optional[List[Character]] = None
         self.completed_quests: int = 0
         self.base_health = self.max_health
         self.base_attack = self.attack
@@ -208,328 +379,449 @@ class Player(Character):
         self.equipment: Dict[str, Optional[Item]] = {"weapon": None, "armor": None, "shield": None, "accessory": None}
         self.current_rank: QuestRank = QuestRank.F
         self.rank_progress: int = 0
-        self.rank_threshold: int = self.RANK_THRESHOLDS[QuestRank.F]
+        self.rank_threshold: int = self.RANK_THRESHOLDS[QuestRank.F.value]
         self.revives: int = 3  # Number of revives available
 
+    @property
+    def roster(self) -> List[Character]:
+        # The player plus living party members, as sent into combat. Cached until
+        # the live party changes; callers must not modify it.
+        if self._roster is None:
+            self._roster = [self, *self.live_party]
+        return self._roster
+
+    def recruit(self, npc: 'NPC'):
+        npc.leader = self
+        self.party.append(npc)
+        if npc.alive:
+            self.live_party.append(npc)
+            self._roster = None
+
+    def dismiss(self, index: int) -> 'NPC':
+        npc = self.party.pop(index)
+        npc.leader = None
+        if npc.alive:
+            self.live_party.remove(npc)
+            self._roster = None
+        return npc
+
+    def _member_fell(self, npc: 'NPC'):
+        # Called by NPC.die so the roster cache is only ever touched here.
+        self.live_party.remove(npc)
+        self._roster = None
+
     def recalc_stats(self):
-        self.attack = self.base_attack + sum(item.attack for item in self.equipment.values() if item)
-        self.defense = self.base_defense + sum(item.defense for item in self.equipment.values() if item)
-        self.magic_power = self.base_magic + sum(item.magic for item in self.equipment.values() if item)
+        # Only called when equipment or base stats change; combat reads the stored totals.
+        attack, defense, magic = self.base_attack, self.base_defense, self.base_magic
+        for item in self.equipment.values():
+            if item:
+                attack += item.attack
+                defense += item.defense
+                magic += item.magic
+        self.attack = attack
+        self.defense = defense
+        self.magic_power = magic
+
+    def required_exp(self) -> int:
+        if self.level < len(self.REQUIRED_EXP):
+            return self.REQUIRED_EXP[self.level]
+        return 100 + (self.level - 1) * 20
 
     def check_level_up(self):
-        required_exp = 100 + (self.level - 1) * 20
+        required_exp = self.required_exp()
         leveled_up = False
+        d_health, d_attack, d_defense, d_magic = self.LEVEL_GAINS.get(self.char_class, (0, 0, 0, 0))
         while self.exp >= required_exp:
             self.exp -= required_exp
             self.level += 1
             leveled_up = True
-            if self.char_class == 'Warrior':
-                self.base_health += 15
-                self.base_attack += 3
-                self.base_defense += 2
-                self.base_magic += 1
-            elif self.char_class == 'Mage':
-                self.base_health += 8
-                self.base_attack += 1
-                self.base_defense += 1
-                self.base_magic += 4
-            elif self.char_class == 'Rogue':
-                self.base_health += 10
-                self.base_attack += 2
-                self.base_defense += 2
-                self.base_magic += 2
+            self.base_health += d_health
+            self.base_attack += d_attack
+            self.base_defense += d_defense
+            self.base_magic += d_magic
             self.max_health = self.base_health
             self.health = self.max_health
-            print(Fore.GREEN + f"\n*** Congratulations! You've leveled up to Level {self.level}! ***")
-            required_exp = 100 + (self.level - 1) * 20
+            say(Fore.GREEN + f"\n*** Congratulations! You've leveled up to Level {self.level}! ***")
+            required_exp += 20
         if leveled_up:
-            print(Fore.CYAN + f"EXP remaining: {self.exp}/{required_exp}")
+            say(Fore.CYAN + f"EXP remaining: {self.exp}/{required_exp}")
 
     def update_rank_progress(self, difficulty: int):
         base_progress = difficulty * 10
         rank_modifier = (self.current_rank.value * 0.2) + 1
         self.rank_progress += int(base_progress * rank_modifier)
-        print(Fore.MAGENTA + f"\nRank Progress: {self.rank_progress}/{self.rank_threshold}")
+        say(Fore.MAGENTA + f"\nRank Progress: {self.rank_progress}/{self.rank_threshold}")
         if self.rank_progress >= self.rank_threshold:
-            if self.current_rank != QuestRank.SSS:
-                self.current_rank = QuestRank(self.current_rank.value + 1)
-                self.rank_threshold = self.RANK_THRESHOLDS[self.current_rank]
+            next_rank = _NEXT_RANK.get(self.current_rank)
+            if next_rank is not None:
+                self.current_rank = next_rank
+                self.rank_threshold = self.RANK_THRESHOLDS[self.current_rank.value]
                 self.rank_progress = 0
-                print(Fore.GREEN + f"\n*** Achieved {self.current_rank.name} Rank! ***")
+                say(Fore.GREEN + f"\n*** Achieved {self.current_rank.name} Rank! ***")
             else:
-                print(Fore.GREEN + "\n*** Maximum Rank (SSS) Achieved! ***")
+                say(Fore.GREEN + "\n*** Maximum Rank (SSS) Achieved! ***")
 
     def equip_item(self, item: Item, slot: str):
         if self.equipment.get(slot):
             old_item = self.equipment[slot]
             self.inventory.append(old_item)
-            print(Fore.YELLOW + f"Unequipped {old_item.name} from {slot} slot.")
+            say(Fore.YELLOW + f"Unequipped {old_item.name} from {slot} slot.")
         self.equipment[slot] = item
         self.recalc_stats()
-        print(Fore.GREEN + f"Equipped {item.name} in {slot} slot.")
+        say(Fore.GREEN + f"Equipped {item.name} in {slot} slot.")
 
     def use_consumable(self, consumable: Consumable):
         if consumable.heal_value > 0:
             healed = min(consumable.heal_value, self.max_health - self.health)
             self.health += healed
-            print(Fore.GREEN + f"{self.name} uses {consumable.name} and restores {healed} HP!")
+            say(Fore.GREEN + f"{self.name} uses {consumable.name} and restores {healed} HP!")
         elif consumable.buff_effect:
-            self.status_effects[consumable.buff_effect] = {"turns": consumable.duration, "buff_percentage": consumable.effect_percentage}
-            print(Fore.GREEN + f"{self.name} uses {consumable.name} and gains {consumable.buff_effect} (+{consumable.effect_percentage}%) for {consumable.duration} turns!")
+            self.apply_status(STATUS_FLAGS[consumable.buff_effect], consumable.duration, consumable.effect_percentage)
+            say(Fore.GREEN + f"{self.name} uses {consumable.name} and gains {consumable.buff_effect} (+{consumable.effect_percentage}%) for {consumable.duration} turns!")
 
     def auto_use_consumables(self):
         if self.health < 0.3 * self.max_health:
-            for item in self.inventory:
+            for i, item in enumerate(self.inventory):
                 if isinstance(item, Consumable) and item.heal_value > 0:
-                    print(Fore.YELLOW + f"\n[Auto-Use] {self.name}'s health is low ({self.health}/{self.max_health}).")
+                    say(Fore.YELLOW + f"\n[Auto-Use] {self.name}'s health is low ({self.health}/{self.max_health}).")
                     self.use_consumable(item)
-                    self.inventory.remove(item)
+                    del self.inventory[i]
                     break
 
 class NPC(Character):
+    __slots__ = ('_quest_interest', 'leader')
+
     def __init__(self, name: str, element: Element, alignment: Alignment):
-        super().__init__(name, random.randint(80, 120), random.randint(8, 15),
-                         random.randint(5, 10), random.randint(5, 15), element, alignment)
-        self.quest_interest: Dict[str, int] = {
-            'combat': random.randint(0, 10),
-            'exploration': random.randint(0, 10),
-            'social': random.randint(0, 10)
-        }
+        _randint = RNG.randint
+        super().__init__(name, _randint(80, 120), _randint(8, 15),
+                         _randint(5, 10), _randint(5, 15), element, alignment)
+        self._quest_interest: Optional[QuestInterest] = None
+        self.leader: Optional[Player] = None  # Player whose party this NPC is in
+
+    def reset(self, name: str, element: Element, alignment: Alignment):
+        # Re-roll a pooled NPC in place instead of constructing a new one.
+        _randint = RNG.randint
+        self._reset(name, _randint(80, 120), _randint(8, 15),
+                    _randint(5, 10), _randint(5, 15), element, alignment)
+        self._quest_interest = None
+        self.leader = None
+
+    def die(self):
+        self.alive = False
+        if self.leader is not None:
+            self.leader._member_fell(self)
+
+    @property
+    def quest_interest(self) -> QuestInterest:
+        if self._quest_interest is None:
+            _randint = RNG.randint
+            self._quest_interest = QuestInterest(_randint(0, 10), _randint(0, 10), _randint(0, 10))
+        return self._quest_interest
+
+class NPCPool:
+    """Recycles combat NPCs between encounters so each fight doesn't allocate new ones."""
+    def __init__(self):
+        self._free: List[NPC] = []
+
+    def acquire(self, name: str, element: Element, alignment: Alignment) -> NPC:
+        if not self._free:
+            return NPC(name, element, alignment)
+        npc = self._free.pop()
+        npc.reset(name, element, alignment)
+        return npc
+
+    def release(self, npcs: List[NPC]):
+        self._free.extend(npcs)
 
 # --- AI / Procedural Story Generation ---
+STORY_TEMPLATES = (
+    "A dark omen hovers over the land as whispers of ancient evils resurface.",
+    "In the mists of dawn, a call for heroes echoes from the forgotten ruins.",
+    "The winds of destiny carry a tale of lost kingdoms and forgotten lore.",
+    "A mysterious force stirs in the depths of the enchanted forest."
+)
+
 def generate_dynamic_story(prompt: str, max_length: int = 50) -> str:
     # For simplicity, we are using a procedural fallback if the AI is unavailable.
     # (If you have transformers installed, you can modify this function to call ai_generator.)
-    templates = [
-        "A dark omen hovers over the land as whispers of ancient evils resurface.",
-        "In the mists of dawn, a call for heroes echoes from the forgotten ruins.",
-        "The winds of destiny carry a tale of lost kingdoms and forgotten lore.",
-        "A mysterious force stirs in the depths of the enchanted forest."
-    ]
-    return random.choice(templates)
+    return RNG.choice(STORY_TEMPLATES)
 
 # --- Procedural Generation Systems ---
 class WorldGenerator:
     TIER_QUESTS = {
-        QuestRank.F: [
+        QuestRank.F: (
             ("Slime Extermination", "Defeat {n} Slimes in the forest", "slimes", 3, 5),
             ("Rat Patrol", "Clear {n} Giant Rats from the sewers", "rats", 2, 4),
             ("Herb Collection", "Gather {n} medicinal herbs for the apothecary", "herbs", 5, 8),
             ("Lost Package", "Recover {n} lost packages from the wilderness", "packages", 3, 5),
             ("Scout Duty", "Patrol the village outskirts for {n} hours", "hours", 4, 6)
-        ],
-        QuestRank.E: [
+        ),
+        QuestRank.E: (
             ("Goblin Camp", "Clear {n} Goblin camps near the village", "camps", 2, 3),
             ("Spider Silk", "Collect {n} bundles of spider silk", "silk", 4, 6),
             ("Bandit Hunt", "Defeat {n} bandits harassing travelers", "bandits", 3, 5),
             ("Ancient Relics", "Recover {n} ancient relics from ruins", "relics", 2, 4),
             ("Wolves' Bane", "Protect livestock from {n} wolves", "wolves", 4, 6)
-        ],
-        QuestRank.D: [
+        ),
+        QuestRank.D: (
             ("Orc Raid", "Defeat {n} Orc raiders in the mountains", "orcs", 3, 5),
             ("Mystic Crystal", "Find {n} Mystic Crystals in the Crystal Caverns", "crystals", 2, 4),
             ("Treasure Hunt", "Retrieve {n} treasure chests from the pirate ship", "treasures", 3, 5),
             ("Forest Fire", "Extinguish {n} forest fires", "fires", 4, 6),
             ("Desert Bandits", "Defeat {n} Desert Bandits", "bandits", 3, 5)
-        ],
-        QuestRank.C: [
+        ),
+        QuestRank.C: (
             ("Troll Bridge", "Build a bridge over the river using {n} trolls", "trolls", 2, 3),
             ("Haunted Mansion", "Clear {n} ghosts from the haunted mansion", "ghosts", 4, 6),
             ("Mine Collapse", "Rescue miners trapped in the collapsing mine", "miners", 3, 5),
             ("Dragon Cave", "Defeat {n} baby dragons in the dragon cave", "dragons", 2, 4),
             ("Frozen Lake", "Break the ice on the frozen lake", "ice", 4, 6)
-        ],
-        QuestRank.B: [
+        ),
+        QuestRank.B: (
             ("Golem Army", "Defeat {n} stone golems", "golems", 3, 5),
             ("Phoenix Nest", "Destroy {n} phoenix nests", "nests", 2, 4),
             ("Volcano Eruption", "Contain the volcano eruption", "volcano", 3, 5),
             ("Haunted Forest", "Clear the haunted forest", "forest", 4, 6),
             ("Ice Troll", "Defeat {n} ice trolls", "trolls", 3, 5)
-        ],
-        QuestRank.A: [
+        ),
+        QuestRank.A: (
             ("Lich Tower", "Defeat the lich in the tower", "lich", 1, 1),
             ("Demon Gate", "Seal the demon gate", "gate", 1, 1),
             ("Mystical Dragon", "Capture the mystical dragon", "dragon", 1, 1),
             ("Dark Wizard", "Defeat the dark wizard", "wizard", 1, 1),
             ("Undead Army", "Defeat the undead army", "army", 1, 1)
-        ],
-        QuestRank.S: [
+        ),
+        QuestRank.S: (
             ("Dragon Queen", "Defeat the dragon queen", "queen", 1, 1),
             ("Devil's Lair", "Destroy the devil's lair", "lair", 1, 1),
             ("Celestial Being", "Summon a celestial being", "being", 1, 1),
             ("Eldritch Horror", "Banish the eldritch horror", "horror", 1, 1),
             ("Time Guardian", "Defeat the time guardian", "guardian", 1, 1)
-        ],
-        QuestRank.SS: [
+        ),
+        QuestRank.SS: (
             ("Ancient God", "Defeat the ancient god", "god", 1, 1),
             ("Primordial Chaos", "Seal primordial chaos", "chaos", 1, 1),
             ("Cosmic Anomaly", "Contain the cosmic anomaly", "anomaly", 1, 1),
             ("Dimensional Rift", "Close the dimensional rift", "rift", 1, 1),
             ("Planar Invader", "Defeat the planar invader", "invader", 1, 1)
-        ],
-        QuestRank.SSS: [
+        ),
+        QuestRank.SSS: (
             ("DemiGod Slayer", "Defeat {n} Demi-Humans from the Astral Plane", "demihumans", 1, 1),
             ("Worldbreaker", "Stop {n} Reality Collapse Events", "collapses", 1, 2),
             ("Titan's Fall", "Slay {n} Primordial Titans", "titans", 1, 1),
             ("Void Walker", "Close {n} Corrupted Dimension Rifts", "rifts", 1, 3),
             ("Eternal Champion", "Win {n} Trials of the Infinite Arena", "trials", 3, 5)
-        ]
+        )
     }
 
+    NPC_NAMES = (
+        "Aelien", "Branwen", "Caelum", "Drystan", "Eirian",
+        "Faelar", "Gwyneth", "Haelia", "Ithilien", "Kyros"
+    )
+
     @staticmethod
     def generate_npc() -> NPC:
-        name = random.choice([
-            "Aelien", "Branwen", "Caelum", "Drystan", "Eirian",
-            "Faelar", "Gwyneth", "Haelia", "Ithilien", "Kyros"
-        ])
-        return NPC(name=name,
-                   element=Element(random.choice(list(Element))),
-                   alignment=Alignment(random.choice(list(Alignment))))
+        _choice = RNG.choice
+        return NPC(name=_choice(WorldGenerator.NPC_NAMES),
+                   element=_choice(ELEMENTS),
+                   alignment=_choice(ALIGNMENTS))
+
+    @staticmethod
+    def generate_npcs(n: int, pool: Optional[NPCPool] = None) -> List[NPC]:
+        # Draw each column for the whole batch in one call instead of per NPC.
+        names = RNG.choices(WorldGenerator.NPC_NAMES, k=n)
+        elements = RNG.choices(ELEMENTS, k=n)
+        alignments = RNG.choices(ALIGNMENTS, k=n)
+        make = pool.acquire if pool else NPC
+        return [make(name, element, alignment)
+                for name, element, alignment in zip(names, elements, alignments)]
 
     @staticmethod
     def generate_quest(player_rank: QuestRank) -> 'Quest':
-        templates = WorldGenerator.TIER_QUESTS[player_rank]
-        name, desc_template, target, min_count, max_count = random.choice(templates)
-        count = random.randint(min_count, max_count)
-        difficulty = player_rank.value * 10 + random.randint(-2, 2)
-        story_prompt = f"{name}: {desc_template.replace('{n}', str(count))}."
-        dynamic_story = generate_dynamic_story(story_prompt, max_length=150)
-        full_description = f"{desc_template.replace('{n}', str(count))}\n\n{dynamic_story}"
-        return Quest(name=name, description=full_description, difficulty=difficulty,
-                     target=target, target_count=count,
-                     rewards={'exp': 50 * player_rank.value,
-                              'gold': 25 * player_rank.value,
-                              'items': [ItemGenerator.generate_item(player_rank.value)] if random.random() > 0.7 else []})
+        return WorldGenerator.generate_quests(1, player_rank)[0]
+
+    @staticmethod
+    def generate_quests(n: int, player_rank: QuestRank) -> List['Quest']:
+        _randint = RNG.randint
+        _random = RNG.random
+        # Template picks and difficulty offsets are drawn for the whole batch up front.
+        picks = RNG.choices(WorldGenerator.TIER_QUESTS[player_rank], k=n)
+        offsets = RNG.choices(range(-2, 3), k=n)
+        quests = []
+        for (name, desc_template, target, min_count, max_count), offset in zip(picks, offsets):
+            count = _randint(min_count, max_count)
+            description = desc_template.replace('{n}', str(count))
+            dynamic_story = generate_dynamic_story(f"{name}: {description}.", max_length=150)
+            full_description = f"{description}\n\n{dynamic_story}"
+            quests.append(Quest(name=name, description=full_description,
+                                difficulty=player_rank.value * 10 + offset,
+                                target=target, target_count=count,
+                                rewards={'exp': 50 * player_rank.value,
+                                         'gold': 25 * player_rank.value,
+                                         # Loot is rolled now but only built if the quest is won.
+                                         'item_tiers': [player_rank.value] if _random() > 0.7 else []}))
+        return quests
 
 class ItemGenerator:
+    PREFIXES = ("Rusty", "Basic", "Sharp", "Sturdy", "Enchanted", "Epic", "Legendary", "Mythic")
+    SUFFIXES = ("Power", "Wisdom", "the Ages", "Destiny", "Elements")
+    ITEM_TYPES = ("Sword", "Axe", "Bow", "Dagger", "Staff", "Wand", "Tome", "Armor", "Shield", "Ring", "Amulet")
+
     @staticmethod
     def generate_item(tier: int) -> Item:
-        prefixes = ["Rusty", "Basic", "Sharp", "Sturdy", "Enchanted", "Epic", "Legendary", "Mythic"]
-        suffixes = ["Power", "Wisdom", "the Ages", "Destiny", "Elements"]
-        item_types = ["Sword", "Axe", "Bow", "Dagger", "Staff", "Wand", "Tome", "Armor", "Shield", "Ring", "Amulet"]
-        return Item(name=f"{random.choice(prefixes)} {random.choice(item_types)} of {random.choice(suffixes)}",
-                    attack=random.randint(1, tier*2),
-                    defense=random.randint(1, tier*2),
-                    magic=random.randint(1, tier*2))
+        return ItemGenerator.generate_items(1, tier)[0]
+
+    @staticmethod
+    def generate_items(n: int, tier: int) -> List[Item]:
+        # Same batching as WorldGenerator.generate_npcs: one draw per column.
+        prefixes = RNG.choices(ItemGenerator.PREFIXES, k=n)
+        types = RNG.choices(ItemGenerator.ITEM_TYPES, k=n)
+        suffixes = RNG.choices(ItemGenerator.SUFFIXES, k=n)
+        stats = RNG.choices(range(1, tier*2 + 1), k=3*n)
+        return [Item(name=f"{prefix} {item_type} of {suffix}",
+                     attack=stats[i], defense=stats[n + i], magic=stats[2*n + i])
+                for i, (prefix, item_type, suffix) in enumerate(zip(prefixes, types, suffixes))]
 
 # --- Combat System with Weapon Effects and Revives ---
+_is_alive = attrgetter('alive')
+
+class OnHitEffect(NamedTuple):
+    flag: int         # status bit to apply
+    turns: int
+    dot: bool         # deals 5% of max HP (min 5) per turn
+    color: str
+    message: str      # formatted with target, weapon and damage
+
+def apply_on_hit(target: Character, effect: OnHitEffect, weapon: str = ""):
+    # Targets already carrying the status are left alone.
+    if target.status_mask & effect.flag:
+        return
+    damage = max(5, int(0.05 * target.max_health)) if effect.dot else 0
+    target.apply_status(effect.flag, effect.turns, damage)
+    say(effect.color + effect.message.format(target=target.name, weapon=weapon, damage=damage))
+
+# On-hit effects of the attacker's own element.
+ELEMENT_ON_HIT = {
+    Element.FIRE: OnHitEffect(BURN, 5, True, Fore.RED,
+                              "🔥 {target} is burned! (5 turns, {damage} damage per turn)"),
+    Element.ICE: OnHitEffect(FROZEN, 5, False, Fore.BLUE, "❄️ {target} is frozen! (5 turns)"),
+    Element.DARK: OnHitEffect(CURSED, 5, False, Fore.MAGENTA, "🌑 {target} is cursed! (5 turns)"),
+}
+
+# On-hit weapon effects, keyed by Item.effect.
+WEAPON_ON_HIT = {
+    "Bleed": OnHitEffect(BLEED, 5, True, Fore.RED,
+                         "💔 {target} starts bleeding from {weapon}! (5 turns, {damage} damage per turn)"),
+    "Stun": OnHitEffect(STUNNED, 1, False, Fore.YELLOW, "😵 {target} is stunned by {weapon}!"),
+    "Burn": OnHitEffect(BURN, 5, True, Fore.RED,
+                        "🔥 {target} is burned by {weapon}! (5 turns, {damage} damage per turn)"),
+    "Freeze": OnHitEffect(FROZEN, 5, False, Fore.BLUE, "❄️ {target} is frozen by {weapon}!"),
+    "Curse": OnHitEffect(CURSED, 5, False, Fore.MAGENTA, "🌑 {target} is cursed by {weapon}!"),
+}
+
 class CombatSystem:
     @staticmethod
     def calculate_damage(attacker: Character, defender: Character) -> int:
-        base_damage = max(1, (attacker.attack * random.uniform(0.8, 1.2)) -
-                          (defender.defense * random.uniform(0.7, 1.0)))
+        # Inlined RNG.uniform(0.8, 1.2) and RNG.uniform(0.7, 1.0): same draws, no extra Python calls.
+        _random = RNG.random
+        base_damage = max(1, (attacker.attack * (0.8 + 0.4 * _random())) -
+                          (defender.defense * (0.7 + 0.3 * _random())))
         multiplier = 1.0
-        if "Empowered" in attacker.status_effects:
+        status = attacker.status_mask
+        if status & EMPOWERED:
             multiplier *= 1.2
-        if "Cursed" in attacker.status_effects:
+        if status & CURSED:
             multiplier *= 0.5
         return int(base_damage * multiplier)
 
     @staticmethod
     def party_vs_enemies(player_party: List[Character], enemies: List[Character]) -> bool:
-        print(Fore.MAGENTA + "\n--- COMBAT BEGINS ---" + Style.RESET_ALL)
+        _randrange = RNG.randrange
+        _random = RNG.random
+        say(Fore.MAGENTA + "\n--- COMBAT BEGINS ---" + Style.RESET_ALL)
+        # Per-side alive mask plus a compact list of living indices, kept up to date
+        # as combatants fall so nothing has to rescan the sides.
+        party_alive = bytearray(map(_is_alive, player_party))
+        enemy_alive = bytearray(map(_is_alive, enemies))
+        live_party = [i for i, alive in enumerate(party_alive) if alive]
+        live_enemies = [i for i, alive in enumerate(enemy_alive) if alive]
         round_counter = 1
-        while any(c.alive for c in player_party) and any(e.alive for e in enemies):
-            print(Fore.CYAN + f"\n--- Round {round_counter} ---" + Style.RESET_ALL)
+        while live_party and live_enemies:
+            say(Fore.CYAN + f"\n--- Round {round_counter} ---" + Style.RESET_ALL)
             # Process status effects for everyone.
-            for char in player_party + enemies:
-                if char.alive:
-                    char.process_status_effects()
-                    if char.health <= 0:
-                        if isinstance(char, Player):
-                            if char.revives > 0:
-                                char.revives -= 1
-                                char.health = char.max_health // 2
-                                print(Fore.YELLOW + f"{char.name} has fallen but is revived! Revives left: {char.revives}. Health restored to {char.health}.")
+            for side, alive_mask, live in ((player_party, party_alive, live_party), (enemies, enemy_alive, live_enemies)):
+                for i, char in enumerate(side):
+                    if alive_mask[i]:
+                        char.process_status_effects()
+                        if char.health <= 0:
+                            if isinstance(char, Player):
+                                if char.revives > 0:
+                                    char.revives -= 1
+                                    char.health = char.max_health // 2
+                                    say(Fore.YELLOW + f"{char.name} has fallen but is revived! Revives left: {char.revives}. Health restored to {char.health}.")
+                                else:
+                                    say(Fore.RED + f"{char.name} has fallen in battle permanently!")
+                                    char.die()
                             else:
-                                print(Fore.RED + f"{char.name} has fallen in battle permanently!")
-                                char.alive = False
-                        else:
-                            print(Fore.RED + f"{char.name} has fallen in battle!")
-                            char.alive = False
+                                say(Fore.RED + f"{char.name} has fallen in battle!")
+                                char.die()
+                            if not char.alive:
+                                alive_mask[i] = 0
+                                # Swap-remove from the live list; order there doesn't matter.
+                                pos = live.index(i)
+                                live[pos] = live[-1]
+                                live.pop()
+            # Deaths only happen above, so the live lists hold for the rest of the round.
+            n_enemies = len(live_enemies)
+            n_party = len(live_party)
             # Player party turn.
-            for char in player_party:
-                if not char.alive:
+            for i, char in enumerate(player_party):
+                if not party_alive[i]:
                     continue
-                if "Frozen" in char.status_effects or "Stunned" in char.status_effects:
-                    print(Fore.YELLOW + f"{char.name} is unable to act this round due to status effects!")
+                if char.status_mask & CANNOT_ACT:
+                    say(Fore.YELLOW + f"{char.name} is unable to act this round due to status effects!")
                     continue
                 if isinstance(char, Player):
                     char.auto_use_consumables()
-                living_enemies = [e for e in enemies if e.alive]
-                if not living_enemies:
+                if not n_enemies:
                     break
-                target = random.choice(living_enemies)
+                # Single-target rounds (solo player, lone mob) need no random pick.
+                target = enemies[live_enemies[0] if n_enemies == 1 else live_enemies[_randrange(n_enemies)]]
                 damage = CombatSystem.calculate_damage(char, target)
                 target.health = max(0, target.health - damage)
-                action_phrases = {
-                    Element.FIRE: "ignites",
-                    Element.WATER: "soaks",
-                    Element.EARTH: "smashes",
-                    Element.AIR: "slices through",
-                    Element.LIGHT: "blazes upon",
-                    Element.DARK: "shrouds",
-                    Element.NATURE: "entangles",
-                    Element.LIGHTNING: "electrocutes",
-                    Element.ICE: "freezes",
-                    Element.POISON: "corrodes"
-                }
-                phrase = action_phrases.get(char.element, "attacks")
-                print(Fore.GREEN + f"🔥 {char.name} {phrase} {target.name} for {damage} damage! (HP: {target.health}/{target.max_health})")
+                say(Fore.GREEN + f"🔥 {char.name} {ACTION_PHRASES[char.element]} {target.name} for {damage} damage! (HP: {target.health}/{target.max_health})")
                 chance = 0.10 + (char.attack / 1000)
                 # Base elemental effects (from player's element)
-                if char.element == Element.FIRE and random.random() < chance and "Burn" not in target.status_effects:
-                    burn_damage = max(5, int(0.05 * target.max_health))
-                    target.status_effects["Burn"] = {"turns": 5, "damage_per_turn": burn_damage}
-                    print(Fore.RED + f"🔥 {target.name} is burned! (5 turns, {burn_damage} damage per turn)")
-                elif char.element == Element.ICE and random.random() < chance and "Frozen" not in target.status_effects:
-                    target.status_effects["Frozen"] = {"turns": 5}
-                    print(Fore.BLUE + f"❄️ {target.name} is frozen! (5 turns)")
-                elif char.element == Element.DARK and random.random() < chance and "Cursed" not in target.status_effects:
-                    target.status_effects["Cursed"] = {"turns": 5}
-                    print(Fore.MAGENTA + f"🌑 {target.name} is cursed! (5 turns)")
+                effect = ELEMENT_ON_HIT.get(char.element)
+                if effect and _random() < chance:
+                    apply_on_hit(target, effect)
                 # Weapon-based effects (trigger regardless of base element)
                 if isinstance(char, Player):
                     weapon = char.equipment.get("weapon")
-                    if weapon and weapon.effect and random.random() < (weapon.effect_chance + chance):
-                        if weapon.effect == "Bleed" and "Bleed" not in target.status_effects:
-                            bleed_damage = max(5, int(0.05 * target.max_health))
-                            target.status_effects["Bleed"] = {"turns": 5, "damage_per_turn": bleed_damage}
-                            print(Fore.RED + f"💔 {target.name} starts bleeding from {weapon.name}! (5 turns, {bleed_damage} damage per turn)")
-                        elif weapon.effect == "Stun" and "Stunned" not in target.status_effects:
-                            target.status_effects["Stunned"] = {"turns": 1}
-                            print(Fore.YELLOW + f"😵 {target.name} is stunned by {weapon.name}!")
-                        elif weapon.effect == "Burn" and "Burn" not in target.status_effects:
-                            burn_damage = max(5, int(0.05 * target.max_health))
-                            target.status_effects["Burn"] = {"turns": 5, "damage_per_turn": burn_damage}
-                            print(Fore.RED + f"🔥 {target.name} is burned by {weapon.name}! (5 turns, {burn_damage} damage per turn)")
-                        elif weapon.effect == "Freeze" and "Frozen" not in target.status_effects:
-                            target.status_effects["Frozen"] = {"turns": 5}
-                            print(Fore.BLUE + f"❄️ {target.name} is frozen by {weapon.name}!")
-                        elif weapon.effect == "Curse" and "Cursed" not in target.status_effects:
-                            target.status_effects["Cursed"] = {"turns": 5}
-                            print(Fore.MAGENTA + f"🌑 {target.name} is cursed by {weapon.name}!")
+                    if weapon and weapon.effect and _random() < (weapon.effect_chance + chance):
+                        effect = WEAPON_ON_HIT.get(weapon.effect)
+                        if effect:
+                            apply_on_hit(target, effect, weapon.name)
             # Enemies' turn.
-            for enemy in enemies:
-                if not enemy.alive:
+            for i, enemy in enumerate(enemies):
+                if not enemy_alive[i]:
                     continue
-                if "Frozen" in enemy.status_effects or "Stunned" in enemy.status_effects:
-                    print(Fore.YELLOW + f"{enemy.name} is unable to act this round due to status effects!")
+                if enemy.status_mask & CANNOT_ACT:
+                    say(Fore.YELLOW + f"{enemy.name} is unable to act this round due to status effects!")
                     continue
-                living_players = [c for c in player_party if c.alive]
-                if not living_players:
+                if not n_party:
                     break
-                target = random.choice(living_players)
+                target = player_party[live_party[0] if n_party == 1 else live_party[_randrange(n_party)]]
                 damage = CombatSystem.calculate_damage(enemy, target)
                 target.health = max(0, target.health - damage)
-                print(Fore.RED + f"👹 {enemy.name} attacks {target.name} for {damage} damage! (HP: {target.health}/{target.max_health})")
+                say(Fore.RED + f"👹 {enemy.name} attacks {target.name} for {damage} damage! (HP: {target.health}/{target.max_health})")
             round_counter += 1
-        return any(c.alive for c in player_party)
+        return bool(live_party)
 
 class RelationshipSystem:
     @staticmethod
     def handle_shared_quest(player: Player, npc: NPC, quest: 'Quest'):
-        relationship_change = random.randint(10, 25)
+        relationship_change = RNG.randint(10, 25)
         if quest.success:
             npc.update_relationship(player, relationship_change, f"Successfully completed {quest.description}")
             player.update_relationship(npc, relationship_change // 2, "Worked well together")
@@ -539,130 +831,182 @@ class RelationshipSystem:
 
     @staticmethod
     def check_party_morale(party: List[NPC]) -> float:
-        return sum(npc.personality['loyalty'] for npc in party) / len(party) if party else 0
-
-def get_mob_properties(mob_name: str) -> Dict[str, List[Enum]]:
-    mob_properties = {
-        "Slime": {"elements": [Element.WATER, Element.POISON, Element.NATURE],
-                  "alignments": [Alignment.TRUE_NEUTRAL, Alignment.CHAOTIC_NEUTRAL]},
-        "Goblin": {"elements": [Element.EARTH, Element.FIRE, Element.DARK],
-                   "alignments": [Alignment.CHAOTIC_NEUTRAL, Alignment.CHAOTIC_EVIL]},
-        "Shadow Beast": {"elements": [Element.DARK],
-                         "alignments": [Alignment.CHAOTIC_EVIL, Alignment.NEUTRAL_EVIL]},
-        "Rat": {"elements": [Element.EARTH, Element.POISON],
-                "alignments": [Alignment.TRUE_NEUTRAL, Alignment.CHAOTIC_NEUTRAL]},
-        "Spider": {"elements": [Element.POISON, Element.DARK],
-                   "alignments": [Alignment.NEUTRAL_EVIL, Alignment.CHAOTIC_NEUTRAL]},
-        "Skeleton": {"elements": [Element.DARK],
-                     "alignments": [Alignment.LAWFUL_EVIL, Alignment.NEUTRAL_EVIL]},
-        "Dark Mage": {"elements": [Element.DARK, Element.FIRE, Element.ICE],
-                      "alignments": [Alignment.NEUTRAL_EVIL, Alignment.CHAOTIC_EVIL]},
-        "Stone Golem": {"elements": [Element.EARTH],
-                        "alignments": [Alignment.LAWFUL_NEUTRAL, Alignment.TRUE_NEUTRAL]},
-        "Harpy": {"elements": [Element.AIR, Element.LIGHTNING],
-                  "alignments": [Alignment.CHAOTIC_NEUTRAL, Alignment.CHAOTIC_EVIL]},
-        "Werewolf": {"elements": [Element.NATURE, Element.DARK],
-                     "alignments": [Alignment.CHAOTIC_NEUTRAL, Alignment.CHAOTIC_EVIL]},
-        "Dragon Wyrmling": {"elements": [Element.FIRE, Element.ICE, Element.LIGHTNING],
-                           "alignments": [Alignment.LAWFUL_EVIL, Alignment.NEUTRAL_EVIL]},
-        "Lich": {"elements": [Element.DARK, Element.ICE],
-                 "alignments": [Alignment.LAWFUL_EVIL, Alignment.NEUTRAL_EVIL]},
-        "Ancient Guardian": {"elements": [Element.LIGHT, Element.EARTH],
-                             "alignments": [Alignment.LAWFUL_NEUTRAL, Alignment.LAWFUL_EVIL]}
-    }
-    default_properties = {"elements": [Element.DARK], "alignments": [Alignment.NEUTRAL_EVIL]}
-    return mob_properties.get(mob_name, default_properties)
-
-def create_enemy(mob_name: str, enemy_health: int, enemy_attack: int, enemy_defense: int, enemy_magic: int) -> NPC:
-    properties = get_mob_properties(mob_name)
-    element = random.choice(properties["elements"])
-    alignment = random.choice(properties["alignments"])
-    enemy = NPC(name=mob_name, element=element, alignment=alignment)
-    enemy.health = enemy_health
-    enemy.max_health = enemy_health
-    enemy.attack = enemy_attack
-    enemy.defense = enemy_defense
-    enemy.magic_power = enemy_magic
-    for stat in ['health', 'max_health', 'attack', 'defense', 'magic_power']:
-        variation = random.uniform(0.9, 1.1)
-        current_value = getattr(enemy, stat)
-        setattr(enemy, stat, int(current_value * variation))
+        return sum(npc.personality.loyalty for npc in party) / len(party) if party else 0
+
+# Element/alignment pools monsters roll from, by mob.
+MOB_PROPERTIES = MappingProxyType({
+    Mob.SLIME: {"elements": (Element.WATER, Element.POISON, Element.NATURE),
+                "alignments": (Alignment.TRUE_NEUTRAL, Alignment.CHAOTIC_NEUTRAL)},
+    Mob.GOBLIN: {"elements": (Element.EARTH, Element.FIRE, Element.DARK),
+                 "alignments": (Alignment.CHAOTIC_NEUTRAL, Alignment.CHAOTIC_EVIL)},
+    Mob.SHADOW_BEAST: {"elements": (Element.DARK,),
+                       "alignments": (Alignment.CHAOTIC_EVIL, Alignment.NEUTRAL_EVIL)},
+    Mob.RAT: {"elements": (Element.EARTH, Element.POISON),
+              "alignments": (Alignment.TRUE_NEUTRAL, Alignment.CHAOTIC_NEUTRAL)},
+    Mob.SPIDER: {"elements": (Element.POISON, Element.DARK),
+                 "alignments": (Alignment.NEUTRAL_EVIL, Alignment.CHAOTIC_NEUTRAL)},
+    Mob.SKELETON: {"elements": (Element.DARK,),
+                   "alignments": (Alignment.LAWFUL_EVIL, Alignment.NEUTRAL_EVIL)},
+    Mob.DARK_MAGE: {"elements": (Element.DARK, Element.FIRE, Element.ICE),
+                    "alignments": (Alignment.NEUTRAL_EVIL, Alignment.CHAOTIC_EVIL)},
+    Mob.STONE_GOLEM: {"elements": (Element.EARTH,),
+                      "alignments": (Alignment.LAWFUL_NEUTRAL, Alignment.TRUE_NEUTRAL)},
+    Mob.HARPY: {"elements": (Element.AIR, Element.LIGHTNING),
+                "alignments": (Alignment.CHAOTIC_NEUTRAL, Alignment.CHAOTIC_EVIL)},
+    Mob.WEREWOLF: {"elements": (Element.NATURE, Element.DARK),
+                   "alignments": (Alignment.CHAOTIC_NEUTRAL, Alignment.CHAOTIC_EVIL)},
+    Mob.DRAGON_WYRMLING: {"elements": (Element.FIRE, Element.ICE, Element.LIGHTNING),
+                          "alignments": (Alignment.LAWFUL_EVIL, Alignment.NEUTRAL_EVIL)},
+    Mob.LICH: {"elements": (Element.DARK, Element.ICE),
+               "alignments": (Alignment.LAWFUL_EVIL, Alignment.NEUTRAL_EVIL)},
+    Mob.ANCIENT_GUARDIAN: {"elements": (Element.LIGHT, Element.EARTH),
+                           "alignments": (Alignment.LAWFUL_NEUTRAL, Alignment.LAWFUL_EVIL)}
+})
+DEFAULT_MOB_PROPERTIES = MappingProxyType({"elements": (Element.DARK,), "alignments": (Alignment.NEUTRAL_EVIL,)})
+
+def get_mob_properties(mob: Optional[Mob]) -> Dict[str, Tuple[Enum, ...]]:
+    return MOB_PROPERTIES.get(mob, DEFAULT_MOB_PROPERTIES)
+
+def create_enemy(mob: Union[Mob, str], enemy_health: int, enemy_attack: int, enemy_defense: int, enemy_magic: int,
+                 pool: Optional[NPCPool] = None) -> NPC:
+    if isinstance(mob, str):
+        # Any name is allowed; ones that aren't a Mob get the default properties.
+        name = mob
+        mob = MOB_LOOKUP.get(name)
+    else:
+        name = mob.label
+    properties = get_mob_properties(mob)
+    element = RNG.choice(properties["elements"])
+    alignment = RNG.choice(properties["alignments"])
+    enemy = pool.acquire(name, element, alignment) if pool else NPC(name=name, element=element, alignment=alignment)
+    # +/-10% variation per stat (RNG.uniform(0.9, 1.1) inlined).
+    _random = RNG.random
+    enemy.health = int(enemy_health * (0.9 + 0.2 * _random()))
+    enemy.max_health = int(enemy_health * (0.9 + 0.2 * _random()))
+    enemy.attack = int(enemy_attack * (0.9 + 0.2 * _random()))
+    enemy.defense = int(enemy_defense * (0.9 + 0.2 * _random()))
+    enemy.magic_power = int(enemy_magic * (0.9 + 0.2 * _random()))
     return enemy
 
+# Per-level (HP, ATK, DEF, MAG) of each mob; enemy stats scale linearly with level.
+MOB_BASE_STATS = {
+    Mob.SLIME:            (30, 3, 1, 1),
+    Mob.GOBLIN:           (50, 5, 3, 2),
+    Mob.SHADOW_BEAST:     (70, 7, 4, 3),
+    Mob.RAT:              (25, 4, 1, 0),
+    Mob.SPIDER:           (35, 3, 2, 3),
+    Mob.SKELETON:         (45, 6, 3, 1),
+    Mob.DARK_MAGE:        (40, 2, 2, 8),
+    Mob.STONE_GOLEM:      (100, 4, 8, 0),
+    Mob.HARPY:            (45, 6, 2, 3),
+    Mob.WEREWOLF:         (65, 8, 4, 1),
+    Mob.DRAGON_WYRMLING:  (85, 7, 6, 6),
+    Mob.LICH:             (75, 4, 5, 10),
+    Mob.ANCIENT_GUARDIAN: (120, 6, 9, 4),
+}
+DEFAULT_MOB_STATS = (40, 4, 2, 2)
+
+# Farming spots: (location, mob, difficulty multiplier, base EXP)
+FARM_LOCATIONS = (
+    ("Glistening Grove", Mob.SLIME, 0.8, 40),
+    ("Crimson Cavern", Mob.GOBLIN, 1.0, 80),
+    ("Darkened Depths", Mob.SHADOW_BEAST, 1.2, 120),
+    ("Abandoned Sewers", Mob.RAT, 0.6, 30),
+    ("Webbed Forest", Mob.SPIDER, 0.7, 50),
+    ("Ancient Catacombs", Mob.SKELETON, 1.1, 90),
+    ("Forbidden Library", Mob.DARK_MAGE, 1.3, 110),
+    ("Crystal Mines", Mob.STONE_GOLEM, 1.4, 130),
+    ("Windswept Peaks", Mob.HARPY, 1.2, 100),
+    ("Moonlit Grove", Mob.WEREWOLF, 1.5, 140),
+    ("Dragon's Roost", Mob.DRAGON_WYRMLING, 1.7, 160),
+    ("Cursed Sanctum", Mob.LICH, 1.8, 170),
+    ("Temple Ruins", Mob.ANCIENT_GUARDIAN, 1.9, 180)
+)
+FARM_MENU = "\n".join(
+    f"{i}. {loc} - Mob: {mob.label} | Multiplier: {multiplier} | Base EXP: {base_exp}"
+    for i, (loc, mob, multiplier, base_exp) in enumerate(FARM_LOCATIONS, 1))
+
 # --- Shop System with Expanded Inventory ---
+class ShopEntry(NamedTuple):
+    item: Item
+    price: int
+
+# Items are never modified after creation, so every purchase hands out the shared instance.
+SHOP_INVENTORY = (
+    # Basic Weapons
+    ShopEntry(Item("Iron Sword", attack=5), 100),
+    ShopEntry(Item("Bronze Axe", attack=4), 90),
+    ShopEntry(Item("Wooden Bow", attack=3), 80),
+    ShopEntry(Item("Rusty Dagger", attack=2), 60),
+    # Advanced Weapons with effects
+    ShopEntry(Item("Crimson Sword", attack=7, effect="Bleed", effect_chance=0.15), 150),
+    ShopEntry(Item("Thunder Hammer", attack=8, effect="Stun", effect_chance=0.15), 180),
+    ShopEntry(Item("Blazing Axe", attack=9, effect="Burn", effect_chance=0.20), 200),
+    ShopEntry(Item("Frost Dagger", attack=6, effect="Freeze", effect_chance=0.18), 170),
+    ShopEntry(Item("Shadow Bow", attack=7, effect="Curse", effect_chance=0.15), 160),
+    ShopEntry(Item("Celestial Staff", magic=10, effect="Empower", effect_chance=0.20), 220),
+    # Armor and Shields
+    ShopEntry(Item("Steel Armor", defense=5), 150),
+    ShopEntry(Item("Enchanted Shield", defense=4), 130),
+    ShopEntry(Item("Mystic Robe", defense=3, magic=4), 140),
+    # Accessories
+    ShopEntry(Item("Ring of Vitality", defense=2, magic=2), 120),
+    ShopEntry(Item("Amulet of Power", attack=3, magic=3), 130),
+    # Consumables - Healing
+    ShopEntry(Consumable("Health Potion", heal_value=50), 50),
+    ShopEntry(Consumable("Greater Health Potion", heal_value=100), 100),
+    ShopEntry(Consumable("Elixir of Life", heal_value=150), 150),
+    # Consumables - Buffs
+    ShopEntry(Consumable("Attack Booster", duration=5, effect="Attack Boost", effect_percentage=20), 120),
+    ShopEntry(Consumable("Defense Booster", duration=5, effect="Defense Boost", effect_percentage=20), 120),
+    ShopEntry(Consumable("Magic Booster", duration=5, effect="Magic Boost", effect_percentage=20), 120),
+    # Mixed Consumables
+    ShopEntry(Consumable("Stamina Potion", heal_value=30), 40),
+    ShopEntry(Consumable("Adrenaline Shot", heal_value=20, throw_damage=10), 60),
+    # Extra Weapons for variety
+    ShopEntry(Item("Obsidian Blade", attack=10, effect="Bleed", effect_chance=0.25), 250),
+    ShopEntry(Item("Dragon Slayer Sword", attack=12, effect="Stun", effect_chance=0.20), 300),
+    ShopEntry(Item("Wind Cutter", attack=8, effect="Freeze", effect_chance=0.15), 200),
+    ShopEntry(Item("Solar Flare", attack=9, effect="Burn", effect_chance=0.20), 240),
+    ShopEntry(Item("Lunar Edge", attack=7, effect="Curse", effect_chance=0.20), 210),
+)
+
 class Shop:
     def __init__(self):
-        self.inventory = [
-            # Basic Weapons
-            {"item": Item("Iron Sword", attack=5), "price": 100},
-            {"item": Item("Bronze Axe", attack=4), "price": 90},
-            {"item": Item("Wooden Bow", attack=3), "price": 80},
-            {"item": Item("Rusty Dagger", attack=2), "price": 60},
-            # Advanced Weapons with effects
-            {"item": Item("Crimson Sword", attack=7, effect="Bleed", effect_chance=0.15), "price": 150},
-            {"item": Item("Thunder Hammer", attack=8, effect="Stun", effect_chance=0.15), "price": 180},
-            {"item": Item("Blazing Axe", attack=9, effect="Burn", effect_chance=0.20), "price": 200},
-            {"item": Item("Frost Dagger", attack=6, effect="Freeze", effect_chance=0.18), "price": 170},
-            {"item": Item("Shadow Bow", attack=7, effect="Curse", effect_chance=0.15), "price": 160},
-            {"item": Item("Celestial Staff", magic=10, effect="Empower", effect_chance=0.20), "price": 220},
-            # Armor and Shields
-            {"item": Item("Steel Armor", defense=5), "price": 150},
-            {"item": Item("Enchanted Shield", defense=4), "price": 130},
-            {"item": Item("Mystic Robe", defense=3, magic=4), "price": 140},
-            # Accessories
-            {"item": Item("Ring of Vitality", defense=2, magic=2), "price": 120},
-            {"item": Item("Amulet of Power", attack=3, magic=3), "price": 130},
-            # Consumables - Healing
-            {"item": Consumable("Health Potion", heal_value=50), "price": 50},
-            {"item": Consumable("Greater Health Potion", heal_value=100), "price": 100},
-            {"item": Consumable("Elixir of Life", heal_value=150), "price": 150},
-            # Consumables - Buffs
-            {"item": Consumable("Attack Booster", duration=5, effect="Attack Boost", effect_percentage=20), "price": 120},
-            {"item": Consumable("Defense Booster", duration=5, effect="Defense Boost", effect_percentage=20), "price": 120},
-            {"item": Consumable("Magic Booster", duration=5, effect="Magic Boost", effect_percentage=20), "price": 120},
-            # Mixed Consumables
-            {"item": Consumable("Stamina Potion", heal_value=30), "price": 40},
-            {"item": Consumable("Adrenaline Shot", heal_value=20, throw_damage=10), "price": 60},
-            # Extra Weapons for variety
-            {"item": Item("Obsidian Blade", attack=10, effect="Bleed", effect_chance=0.25), "price": 250},
-            {"item": Item("Dragon Slayer Sword", attack=12, effect="Stun", effect_chance=0.20), "price": 300},
-            {"item": Item("Wind Cutter", attack=8, effect="Freeze", effect_chance=0.15), "price": 200},
-            {"item": Item("Solar Flare", attack=9, effect="Burn", effect_chance=0.20), "price": 240},
-            {"item": Item("Lunar Edge", attack=7, effect="Curse", effect_chance=0.20), "price": 210},
-        ]
+        self.inventory = SHOP_INVENTORY
+        # The stock never changes, so the listing is formatted once; only gold is redrawn.
+        lines = [f"{i}. {item} - Price: {price} gold" for i, (item, price) in enumerate(self.inventory, 1)]
+        lines.append(f"{len(self.inventory)+1}. Exit Shop")
+        self._menu = "\n".join(lines)
+        # Menu number as typed -> entry, so input needs no int() parse or range check.
+        self._choices = {str(i): entry for i, entry in enumerate(self.inventory, 1)}
+        self._exit_choice = str(len(self.inventory) + 1)
 
     def enter_shop(self, player: Player):
-        print(Fore.CYAN + "\n*** Welcome to the Shop! ***")
+        say(Fore.CYAN + "\n*** Welcome to the Shop! ***")
         while True:
-            print(Fore.YELLOW + f"Your Gold: {player.gold}")
-            for i, entry in enumerate(self.inventory, 1):
-                item = entry["item"]
-                price = entry["price"]
-                print(f"{i}. {item} - Price: {price} gold")
-            print(f"{len(self.inventory)+1}. Exit Shop")
-            choice = input("Choose an item to buy (number): ").strip()
-            if not choice.isdigit():
-                print(Fore.RED + "Invalid input. Please enter a number.")
-                continue
-            choice = int(choice)
-            if choice == len(self.inventory)+1:
-                print("Exiting shop.")
-                break
-            if 1 <= choice <= len(self.inventory):
-                entry = self.inventory[choice - 1]
-                price = entry["price"]
-                item = entry["item"]
+            say(Fore.YELLOW + f"Your Gold: {player.gold}")
+            say(self._menu)
+            choice = prompt("Choose an item to buy (number): ").strip()
+            entry = self._choices.get(choice)
+            if entry is not None:
+                item, price = entry
                 if player.gold >= price:
                     player.gold -= price
                     player.inventory.append(item)
-                    print(Fore.GREEN + f"You purchased {item.name}!")
+                    say(Fore.GREEN + f"You purchased {item.name}!")
                 else:
-                    print(Fore.RED + "Not enough gold!")
+                    say(Fore.RED + "Not enough gold!")
+            elif choice == self._exit_choice:
+                say("Exiting shop.")
+                break
+            elif choice.isdigit():
+                say(Fore.RED + "Invalid selection.")
             else:
-                print(Fore.RED + "Invalid selection.")
+                say(Fore.RED + "Invalid input. Please enter a number.")
 
 # --- Game Systems ---
-@dataclass
+@dataclass(slots=True)
 class Quest:
     name: str
     description: str
@@ -672,56 +1016,124 @@ class Quest:
     rewards: dict
     success: Optional[bool] = None
 
+class QuestPool:
+    """Hands out pre-generated quests per rank, refilling a rank in batches when it runs dry."""
+    def __init__(self, batch_size: int = 8):
+        self.batch_size = batch_size
+        self._quests: Dict[QuestRank, List[Quest]] = {}
+
+    def next(self, rank: QuestRank) -> Quest:
+        quests = self._quests.get(rank)
+        if not quests:
+            quests = self._quests[rank] = WorldGenerator.generate_quests(self.batch_size, rank)
+        return quests.pop()
+
 # --- Main Game Loop ---
+SPLASH_BANNER = (Fore.CYAN + Style.BRIGHT + r"""
+  _____ _           _                    _____            _             
+ | ____| | ___  ___| |_ _   _ _ __ ___  | ____|_ __   ___| | _____ _ __ 
+ |  _| | |/ _ \/ __| __| | | | '__/ _ \ |  _| | '_ \ / __| |/ / _ \ '__|
+ | |___| |  __/\__ \ |_| |_| | | |  __/ | |___| | | | (__|   <  __/ |   
+ |_____|_|\___||___/\__|\__,_|_|  \___| |_____|_| |_|\___|_|\_\___|_|   
+        """ + Style.RESET_ALL + "\n" +
+                 Back.BLACK + Fore.YELLOW + "Welcome to Elemental Realms!" + Style.RESET_ALL)
+
 class Game:
+    # Menus are static, so each is a single pre-joined block. The colored title
+    # resets itself so the color doesn't run into the option lines.
+    MAIN_MENU = (Fore.CYAN + "\n=== MAIN MENU ===" + Style.RESET_ALL + "\n"
+                 "1. Quest Board\n2. Manage Party\n3. Relationships\n4. Inventory\n5. Travel\n"
+                 "6. View Stats\n7. Shop\n8. Main Story\n9. Quit")
+    TRAVEL_MENU = ("Choose your travel action:\n"
+                   "1. Help Someone\n2. Solve a Mystery\n3. Farm Experience\n4. Explore a Dungeon\n5. Meet Travelers")
+    # Travel weather: 30% clouds, 30% sun, 40% drizzle.
+    WEATHER = ("Dark clouds gather overhead and a chill wind blows...",
+               "The sun shines brightly as you begin your journey.",
+               "A light drizzle falls as you travel, adding to the ambiance.")
+    WEATHER_CUM_WEIGHTS = (3, 6, 10)
+    RECRUIT_CHANCE = 0.4
+    # Every possible travel payout, so a reward is a single RNG.choice:
+    # (gold, exp) for helping, exp for a solved mystery, (exp, gold) for a dungeon.
+    HELP_REWARDS = tuple(product(range(10, 31), range(20, 41)))
+    MYSTERY_REWARDS = tuple(range(30, 51))
+    DUNGEON_REWARDS = tuple(product(range(40, 61), range(30, 51)))
+    WORLD_NPC_COUNT = 20
+
     def __init__(self):
         self.player: Optional[Player] = None
-        self.world_npcs: List[NPC] = [WorldGenerator.generate_npc() for _ in range(20)]
+        self.world_npcs: List[NPC] = WorldGenerator.generate_npcs(self.WORLD_NPC_COUNT)
         self.current_quest: Optional[Quest] = None
+        self.quest_pool = QuestPool()
+        self.npc_pool = NPCPool()
         self.shop = Shop()
+        # EXP earned during the current menu action, applied by _commit_turn().
+        self._pending_exp = 0
+        # Menu choice -> handler ('9' quits and is handled in main_loop).
+        self._menu_actions = {
+            '1': self.quest_system,
+            '2': self.party_management,
+            '3': self.relationship_browser,
+            '4': self.inventory_management,
+            '5': self.travel_system,
+            '6': self.view_stats,
+            '7': lambda: self.shop.enter_shop(self.player),
+            '8': self.main_story,
+        }
+        self._travel_actions = {
+            '1': self.travel_help_someone,
+            '2': self.travel_solve_mystery,
+            '3': self.travel_farm_exp,
+            '4': self.travel_explore_dungeon,
+            '5': self.handle_recruitment,
+        }
+        self._inventory_actions = {
+            'u': self.use_inventory_item,
+            'd': self.drop_inventory_item,
+            'e': self.equip_inventory_item,
+        }
+
+    def reset(self):
+        # Start a new run after a permanent death. The shop, pools and menu tables
+        # carry over; the world keeps its original NPCs (dismissed party members
+        # appended after them are dropped) in a fresh order.
+        self.player = None
+        self.current_quest = None
+        self._pending_exp = 0
+        del self.world_npcs[self.WORLD_NPC_COUNT:]
+        RNG.shuffle(self.world_npcs)
 
     def splash_screen(self):
-        # Display a colorful splash screen and start main menu music.
-        print(Fore.CYAN + Style.BRIGHT + r"""
-  _____ _           _                    _____            _             
- | ____| | ___  ___| |_ _   _ _ __ ___  | ____|_ __   ___| | _____ _ __ 
- |  _| | |/ _ \/ __| __| | | | '__/ _ \ |  _| | '_ \ / __| |/ / _ \ '__|
- | |___| |  __/\__ \ |_| |_| | | |  __/ | |___| | | | (__|   <  __/ |   
- |_____|_|\___||___/\__|\__,_|_|  \___| |_____|_| |_|\___|_|\_\___|_|   
-        """ + Style.RESET_ALL)
-        print(Back.BLACK + Fore.YELLOW + "Welcome to Elemental Realms!" + Style.RESET_ALL)
+        # Display a colorful splash screen.
+        say(SPLASH_BANNER)
+        flush_output()
         time.sleep(1)
 
     def character_creation(self):
-        print(Fore.GREEN + "Let's create your character.\n")
-        name = input("Enter your character's name: ").strip() or "Hero"
-        char_class = input("Choose class (Warrior/Mage/Rogue): ").capitalize().strip()
-        if char_class not in ['Warrior', 'Mage', 'Rogue']:
-            print(Fore.RED + "Invalid class! Defaulting to Warrior.")
+        say(Fore.GREEN + "Let's create your character.\n")
+        name = prompt("Enter your character's name: ").strip() or "Hero"
+        char_class = prompt("Choose class (Warrior/Mage/Rogue): ").strip().capitalize()
+        if char_class not in Player.BASE_STATS:
+            say(Fore.RED + "Invalid class! Defaulting to Warrior.")
             char_class = 'Warrior'
-        print("\nChoose element: " + ", ".join([e.value for e in Element]))
-        element_input = input("Enter element: ").strip().capitalize()
-        try:
-            element = Element(element_input)
-        except ValueError:
-            print(Fore.RED + "Invalid element! Defaulting to Fire.")
+        say("\nChoose element: " + ELEMENT_CHOICES)
+        element = ELEMENT_LOOKUP.get(prompt("Enter element: ").strip().lower())
+        if element is None:
+            say(Fore.RED + "Invalid element! Defaulting to Fire.")
             element = Element.FIRE
-        print("\nChoose alignment:")
-        print(", ".join([a.value for a in Alignment]))
-        alignment_input = input("Enter alignment: ").strip().replace(' ', '_').upper()
-        try:
-            alignment = Alignment[alignment_input]
-        except KeyError:
-            print(Fore.RED + "Invalid alignment! Defaulting to True Neutral.")
+        say("\nChoose alignment:")
+        say(ALIGNMENT_CHOICES)
+        alignment = ALIGNMENT_LOOKUP.get(prompt("Enter alignment: ").strip().lower().replace('_', ' '))
+        if alignment is None:
+            say(Fore.RED + "Invalid alignment! Defaulting to True Neutral.")
             alignment = Alignment.TRUE_NEUTRAL
         self.player = Player(name, char_class, element, alignment)
-        print(Fore.GREEN + f"\nWelcome {self.player.name}, {self.player.alignment.value} {char_class} of {element.value}!")
+        say(Fore.GREEN + f"\nWelcome {self.player.name}, {self.player.alignment.label} {char_class} of {element.label}!")
         self.player.gold = 200
         self.player.inventory.append(Consumable("Health Potion", heal_value=50))
 
     def main_story(self):
-        print(Fore.MAGENTA + "\n=== MAIN STORY ===")
-        print("The epic journey begins...\n")
+        say(Fore.MAGENTA + "\n=== MAIN STORY ===")
+        say("The epic journey begins...\n")
         chapters = [
             {"title": "The Call to Adventure", "prompt": "In the quiet land of Elemental Realms, strange omens and mysterious happenings signal the start of a grand quest."},
             {"title": "Gathering Allies", "prompt": "Our hero meets diverse characters—wise mages, stalwart warriors, and cunning rogues—who join the fight against an unknown evil."},
@@ -730,22 +1142,19 @@ class Game:
             {"title": "The Final Confrontation", "prompt": "At last, the hero reaches the dark fortress, where the Demon Lord awaits with unspeakable power and malice."}
         ]
         for chapter in chapters:
-            print(Fore.CYAN + f"\n--- {chapter['title']} ---")
+            say(Fore.CYAN + f"\n--- {chapter['title']} ---")
             story_text = generate_dynamic_story(chapter["prompt"], max_length=150)
-            print(story_text)
-            input(Fore.YELLOW + "Press Enter to continue...")
-        print(Fore.RED + "\n*** FINAL BATTLE: Demon Lord ***")
-        # Switch music for battle
-        
-        demon_lord = create_enemy("Demon Lord", enemy_health=200, enemy_attack=20, enemy_defense=10, enemy_magic=15)
-        print(Fore.RED + "You face the Demon Lord!")
-        party = [self.player] + self.player.party
-        victory = CombatSystem.party_vs_enemies([c for c in party if c.alive], [demon_lord])
+            say(story_text)
+            prompt(Fore.YELLOW + "Press Enter to continue...")
+        say(Fore.RED + "\n*** FINAL BATTLE: Demon Lord ***")
+        demon_lord = create_enemy(Mob.DEMON_LORD, enemy_health=200, enemy_attack=20, enemy_defense=10, enemy_magic=15)
+        say(Fore.RED + "You face the Demon Lord!")
+        victory = CombatSystem.party_vs_enemies(self.player.roster, [demon_lord])
         
         if victory:
-            print(Fore.GREEN + "\nYou have defeated the Demon Lord and restored peace to the realm!")
+            say(Fore.GREEN + "\nYou have defeated the Demon Lord and restored peace to the realm!")
         else:
-            print(Fore.RED + "\nThe Demon Lord proved too powerful... darkness falls over the land.")
+            say(Fore.RED + "\nThe Demon Lord proved too powerful... darkness falls over the land.")
 
     def estimate_success_probability(self, quest: Quest) -> int:
         base = 50
@@ -755,66 +1164,52 @@ class Game:
         return max(5, min(95, chance))
 
     def handle_recruitment(self):
-        if random.random() < 0.4:
+        if RNG.random() < self.RECRUIT_CHANCE:
             npc = WorldGenerator.generate_npc()
-            print(Fore.CYAN + f"\nYou encountered {npc.name} during your journey.")
-            if input("Recruit them? (y/n): ").lower() == 'y':
-                self.player.party.append(npc)
-                print(Fore.GREEN + f"{npc.name} has joined your party!")
+            say(Fore.CYAN + f"\nYou encountered {npc.name} during your journey.")
+            if prompt("Recruit them? (y/n): ").lower() == 'y':
+                self.player.recruit(npc)
+                say(Fore.GREEN + f"{npc.name} has joined your party!")
             else:
-                print(Fore.YELLOW + f"You decided not to recruit {npc.name}.")
+                say(Fore.YELLOW + f"You decided not to recruit {npc.name}.")
 
     def main_loop(self):
         while True:
             # Check for permanent death (no revives left)
             if not self.player.alive:
-                restart = input(Fore.RED + "You have fallen permanently. Restart the game? (y/n): ").strip().lower()
+                restart = prompt(Fore.RED + "You have fallen permanently. Restart the game? (y/n): ").strip().lower()
                 if restart == 'y':
-                    self.__init__()
+                    self.reset()
                     self.splash_screen()
                     self.character_creation()
                     continue
                 else:
-                    print(Fore.RED + "Exiting game.")
+                    say(Fore.RED + "Exiting game.")
                     break
-            print(Fore.CYAN + "\n=== MAIN MENU ===")
-            print("1. Quest Board")
-            print("2. Manage Party")
-            print("3. Relationships")
-            print("4. Inventory")
-            print("5. Travel")
-            print("6. View Stats")
-            print("7. Shop")
-            print("8. Main Story")
-            print("9. Quit")
-            choice = input("Choose an option: ").strip()
-            if choice == '1':
-                self.quest_system()
-            elif choice == '2':
-                self.party_management()
-            elif choice == '3':
-                self.relationship_browser()
-            elif choice == '4':
-                self.inventory_management()
-            elif choice == '5':
-                self.travel_system()
-            elif choice == '6':
-                self.view_stats()
-            elif choice == '7':
-                self.shop.enter_shop(self.player)
-            elif choice == '8':
-                self.main_story()
+            say(self.MAIN_MENU)
+            choice = prompt("Choose an option: ").strip()
+            action = self._menu_actions.get(choice)
+            if action:
+                action()
+                self._commit_turn()
             elif choice == '9':
-                print(Fore.CYAN + "Thanks for playing Elemental Realms!")
+                say(Fore.CYAN + "Thanks for playing Elemental Realms!")
                 break
             else:
-                print(Fore.RED + "Invalid option. Try again.")
+                say(Fore.RED + "Invalid option. Try again.")
+
+    def _commit_turn(self):
+        # Award the turn's EXP in one go so level-ups are checked once per action.
+        if self._pending_exp:
+            self.player.exp += self._pending_exp
+            self._pending_exp = 0
+            self.player.check_level_up()
 
     def quest_system(self):
-        self.current_quest = WorldGenerator.generate_quest(self.player.current_rank)
-        print(Fore.CYAN + f"\n[{self.player.current_rank.name}] {self.current_quest.name}")
-        print(Fore.YELLOW + f"Description:\n{self.current_quest.description}")
-        if input("Accept quest? (y/n): ").lower() == 'y':
+        self.current_quest = self.quest_pool.next(self.player.current_rank)
+        say(Fore.CYAN + f"\n[{self.player.current_rank.name}] {self.current_quest.name}")
+        say(Fore.YELLOW + f"Description:\n{self.current_quest.description}")
+        if prompt("Accept quest? (y/n): ").lower() == 'y':
             success = self.run_quest()
             self.current_quest.success = success
             self.handle_quest_outcome()
@@ -822,285 +1217,243 @@ class Game:
                 self.player.update_rank_progress(self.current_quest.difficulty)
 
     def run_quest(self) -> bool:
-        enemies = [WorldGenerator.generate_npc() for _ in range(3)]
-        print(Fore.YELLOW + "\nYour party encounters enemies!")
-        party = [self.player] + self.player.party
-        victory = CombatSystem.party_vs_enemies([c for c in party if c.alive], enemies)
+        enemies = WorldGenerator.generate_npcs(3, self.npc_pool)
+        say(Fore.YELLOW + "\nYour party encounters enemies!")
+        victory = CombatSystem.party_vs_enemies(self.player.roster, enemies)
+        self.npc_pool.release(enemies)
         if victory:
-            print(Fore.GREEN + "\nQuest successful!")
+            say(Fore.GREEN + "\nQuest successful!")
             self.player.completed_quests += 1
             self.player.gold += self.current_quest.rewards['gold']
-            self.player.exp += self.current_quest.rewards['exp']
-            for item in self.current_quest.rewards['items']:
-                self.player.inventory.append(item)
-            self.player.check_level_up()
+            self._pending_exp += self.current_quest.rewards['exp']
+            for tier in self.current_quest.rewards['item_tiers']:
+                self.player.inventory.append(ItemGenerator.generate_item(tier))
             return True
         else:
-            print(Fore.RED + "\nQuest failed...")
+            say(Fore.RED + "\nQuest failed...")
             return False
 
     def handle_quest_outcome(self):
-        for npc in self.player.party.copy():
+        survivors = []
+        for npc in self.player.party:
             RelationshipSystem.handle_shared_quest(self.player, npc, self.current_quest)
-            if not npc.alive:
-                print(Fore.RED + f"{npc.name} perished during the quest...")
-                self.player.party.remove(npc)
+            if npc.alive:
+                survivors.append(npc)
+            else:
+                say(Fore.RED + f"{npc.name} perished during the quest...")
+        self.player.party = survivors
         if not self.player.party:
             self.handle_recruitment()
 
     def party_management(self):
         if not self.player.party:
-            print(Fore.YELLOW + "\nYou currently have no party members.")
+            say(Fore.YELLOW + "\nYou currently have no party members.")
             return
-        print(Fore.CYAN + "\n=== PARTY MANAGEMENT ===")
+        say(Fore.CYAN + "\n=== PARTY MANAGEMENT ===")
         for i, npc in enumerate(self.player.party, 1):
-            print(f"{i}. {npc.name} (HP: {npc.health}/{npc.max_health})")
-        choice = input("Manage party member (number) or (b)ack: ").strip().lower()
+            say(f"{i}. {npc.name} (HP: {npc.health}/{npc.max_health})")
+        choice = prompt("Manage party member (number) or (b)ack: ").strip().lower()
         if choice.isdigit() and 0 < int(choice) <= len(self.player.party):
-            npc = self.player.party[int(choice) - 1]
-            print(Fore.YELLOW + f"\n{npc.name}'s Status:")
-            print(f"Element: {npc.element.value}")
-            print(f"Alignment: {npc.alignment.value}")
-            print(f"Relationship: {self.player.relationships.get(npc.name, Relationship()).level.name}")
-            action = input("(e)quip, (d)ismiss, (b)ack: ").lower()
+            index = int(choice) - 1
+            npc = self.player.party[index]
+            say(Fore.YELLOW + f"\n{npc.name}'s Status:")
+            say(f"Element: {npc.element.label}")
+            say(f"Alignment: {npc.alignment.label}")
+            say(f"Relationship: {self.player.relationships.get(npc.name, _EMPTY_RELATIONSHIP).level.name}")
+            action = prompt("(e)quip, (d)ismiss, (b)ack: ").lower()
             if action == 'd':
-                self.world_npcs.append(npc)
-                self.player.party.remove(npc)
-                print(Fore.YELLOW + f"{npc.name} has left the party.")
+                self.world_npcs.append(self.player.dismiss(index))
+                say(Fore.YELLOW + f"{npc.name} has left the party.")
         elif choice == 'b':
             return
         else:
-            print(Fore.RED + "Invalid option.")
+            say(Fore.RED + "Invalid option.")
 
     def relationship_browser(self):
-        print(Fore.CYAN + "\n=== RELATIONSHIPS ===")
-        combined = self.world_npcs + self.player.party
-        if not combined:
-            print("No NPCs to display.")
+        say(Fore.CYAN + "\n=== RELATIONSHIPS ===")
+        world, party = self.world_npcs, self.player.party
+        if not world and not party:
+            say("No NPCs to display.")
             return
-        for npc in combined:
-            rel = self.player.relationships.get(npc.name, Relationship())
-            print(f"{npc.name}: {rel.level.name} ({rel.progress}%)")
-            if input("Show history? (y/n): ").lower() == 'y':
-                for event in rel.history[-3:]:
-                    print(f"- {event}")
+        for i, npc in enumerate(chain(world, party), 1):
+            rel = self.player.relationships.get(npc.name, _EMPTY_RELATIONSHIP)
+            say(f"{i}. {npc.name}: {rel.level.name} ({rel.progress}%)")
+        choice = prompt("Enter NPC number to view history or (b)ack: ").strip().lower()
+        if choice.isdigit() and 0 < int(choice) <= len(world) + len(party):
+            index = int(choice) - 1
+            npc = world[index] if index < len(world) else party[index - len(world)]
+            rel = self.player.relationships.get(npc.name)
+            if rel and rel.history:
+                say("\n".join(f"- {event}" for event in list(rel.history)[-3:]))
+            else:
+                say(f"No history with {npc.name} yet.")
+        elif choice != 'b':
+            say(Fore.RED + "Invalid option.")
 
     def inventory_management(self):
-        print(Fore.CYAN + "\n=== INVENTORY ===")
+        say(Fore.CYAN + "\n=== INVENTORY ===")
         if not self.player.inventory:
-            print("Your inventory is empty.")
+            say("Your inventory is empty.")
             return
         for i, item in enumerate(self.player.inventory, 1):
-            print(f"{i}. {item}")
-        print("(u)se, (d)rop, (e)quip, (b)ack")
-        choice = input("Your choice: ").lower()
-        if choice == 'u':
-            index = input("Enter item number to use: ")
-            if index.isdigit():
-                index = int(index) - 1
-                if 0 <= index < len(self.player.inventory):
-                    item = self.player.inventory[index]
-                    if isinstance(item, Consumable):
-                        self.player.use_consumable(item)
-                        self.player.inventory.pop(index)
-                    else:
-                        print("That item cannot be used right now.")
-        elif choice == 'd':
-            index = input("Enter item number to drop: ")
-            if index.isdigit():
-                index = int(index) - 1
-                if 0 <= index < len(self.player.inventory):
-                    dropped_item = self.player.inventory.pop(index)
-                    print(f"Dropped {dropped_item.name}")
-        elif choice == 'e':
-            index = input("Enter item number to equip: ")
-            if index.isdigit():
-                index = int(index) - 1
-                if 0 <= index < len(self.player.inventory):
-                    item = self.player.inventory[index]
-                    slot = determine_slot(item)
-                    if slot:
-                        self.player.equip_item(item, slot)
-                        self.player.inventory.pop(index)
-                    else:
-                        print("This item cannot be equipped.")
+            say(f"{i}. {item}")
+        say("(u)se, (d)rop, (e)quip, (b)ack")
+        choice = prompt("Your choice: ").lower()
+        action = self._inventory_actions.get(choice)
+        if action:
+            action()
         elif choice == 'b':
             return
         else:
-            print("Invalid option.")
+            say("Invalid option.")
+
+    def use_inventory_item(self):
+        index = prompt("Enter item number to use: ")
+        if index.isdigit():
+            index = int(index) - 1
+            if 0 <= index < len(self.player.inventory):
+                item = self.player.inventory[index]
+                if isinstance(item, Consumable):
+                    self.player.use_consumable(item)
+                    self.player.inventory.pop(index)
+                else:
+                    say("That item cannot be used right now.")
+
+    def drop_inventory_item(self):
+        index = prompt("Enter item number to drop: ")
+        if index.isdigit():
+            index = int(index) - 1
+            if 0 <= index < len(self.player.inventory):
+                dropped_item = self.player.inventory.pop(index)
+                say(f"Dropped {dropped_item.name}")
+
+    def equip_inventory_item(self):
+        index = prompt("Enter item number to equip: ")
+        if index.isdigit():
+            index = int(index) - 1
+            if 0 <= index < len(self.player.inventory):
+                item = self.player.inventory[index]
+                slot = determine_slot(item)
+                if slot:
+                    self.player.equip_item(item, slot)
+                    self.player.inventory.pop(index)
+                else:
+                    say("This item cannot be equipped.")
 
     def travel_system(self):
-        print(Fore.CYAN + "\nYou set out to travel to a new area...")
-        weather_chance = random.random()
-        if weather_chance < 0.3:
-            print("Dark clouds gather overhead and a chill wind blows...")
-        elif weather_chance < 0.6:
-            print("The sun shines brightly as you begin your journey.")
-        else:
-            print("A light drizzle falls as you travel, adding to the ambiance.")
-        print("Choose your travel action:")
-        print("1. Help Someone")
-        print("2. Solve a Mystery")
-        print("3. Farm Experience")
-        print("4. Explore a Dungeon")
-        print("5. Meet Travelers")
-        choice = input("Your choice: ").strip()
-        if choice == '1':
-            self.travel_help_someone()
-        elif choice == '2':
-            self.travel_solve_mystery()
-        elif choice == '3':
-            self.travel_farm_exp()
-        elif choice == '4':
-            self.travel_explore_dungeon()
-        elif choice == '5':
-            self.handle_recruitment()
+        say(Fore.CYAN + "\nYou set out to travel to a new area...")
+        say(RNG.choices(self.WEATHER, cum_weights=self.WEATHER_CUM_WEIGHTS)[0])
+        say(self.TRAVEL_MENU)
+        action = self._travel_actions.get(prompt("Your choice: ").strip())
+        if action:
+            action()
         else:
-            print("Unrecognized action. You wander without incident.")
+            say("Unrecognized action. You wander without incident.")
 
     def travel_help_someone(self):
-        print(Fore.CYAN + "\nYou come across a villager in distress!")
-        success = random.random() < 0.8
+        say(Fore.CYAN + "\nYou come across a villager in distress!")
+        success = RNG.random() < 0.8
         if success:
-            print("You help resolve the problem, earning gratitude and a small reward.")
-            self.player.gold += random.randint(10, 30)
-            self.player.exp += random.randint(20, 40)
-            self.player.check_level_up()
+            say("You help resolve the problem, earning gratitude and a small reward.")
+            gold, exp = RNG.choice(self.HELP_REWARDS)
+            self.player.gold += gold
+            self._pending_exp += exp
         else:
-            print("Despite your efforts, the situation didn't improve much.")
+            say("Despite your efforts, the situation didn't improve much.")
 
     def travel_solve_mystery(self):
-        print(Fore.CYAN + "\nYou investigate strange happenings in a nearby forest.")
+        say(Fore.CYAN + "\nYou investigate strange happenings in a nearby forest.")
         chance = 0.5 + (self.player.level / 100)
-        if random.random() < chance:
-            print("Your keen senses uncover vital clues!")
-            self.player.exp += random.randint(30, 50)
-            self.player.check_level_up()
+        if RNG.random() < chance:
+            say("Your keen senses uncover vital clues!")
+            self._pending_exp += RNG.choice(self.MYSTERY_REWARDS)
         else:
-            print("The mystery remains unsolved.")
+            say("The mystery remains unsolved.")
 
     def travel_farm_exp(self):
-        print(Fore.CYAN + "\nYou head to a training area to farm experience.")
-        farming_locations = {
-            "Glistening Grove": {"mob_name": "Slime", "difficulty_multiplier": 0.8, "base_exp": 40},
-            "Crimson Cavern": {"mob_name": "Goblin", "difficulty_multiplier": 1.0, "base_exp": 80},
-            "Darkened Depths": {"mob_name": "Shadow Beast", "difficulty_multiplier": 1.2, "base_exp": 120},
-            "Abandoned Sewers": {"mob_name": "Rat", "difficulty_multiplier": 0.6, "base_exp": 30},
-            "Webbed Forest": {"mob_name": "Spider", "difficulty_multiplier": 0.7, "base_exp": 50},
-            "Ancient Catacombs": {"mob_name": "Skeleton", "difficulty_multiplier": 1.1, "base_exp": 90},
-            "Forbidden Library": {"mob_name": "Dark Mage", "difficulty_multiplier": 1.3, "base_exp": 110},
-            "Crystal Mines": {"mob_name": "Stone Golem", "difficulty_multiplier": 1.4, "base_exp": 130},
-            "Windswept Peaks": {"mob_name": "Harpy", "difficulty_multiplier": 1.2, "base_exp": 100},
-            "Moonlit Grove": {"mob_name": "Werewolf", "difficulty_multiplier": 1.5, "base_exp": 140},
-            "Dragon's Roost": {"mob_name": "Dragon Wyrmling", "difficulty_multiplier": 1.7, "base_exp": 160},
-            "Cursed Sanctum": {"mob_name": "Lich", "difficulty_multiplier": 1.8, "base_exp": 170},
-            "Temple Ruins": {"mob_name": "Ancient Guardian", "difficulty_multiplier": 1.9, "base_exp": 180}
-        }
-        print("\nAvailable Locations:")
-        for i, (loc, data) in enumerate(farming_locations.items(), 1):
-            print(f"{i}. {loc} - Mob: {data['mob_name']} | Multiplier: {data['difficulty_multiplier']} | Base EXP: {data['base_exp']}")
-        choice = input("Enter the number of the location you want to visit: ").strip()
+        say(Fore.CYAN + "\nYou head to a training area to farm experience.")
+        say("\nAvailable Locations:")
+        say(FARM_MENU)
+        choice = prompt("Enter the number of the location you want to visit: ").strip()
         try:
             choice = int(choice)
-            if 1 <= choice <= len(farming_locations):
-                location_name = list(farming_locations.keys())[choice - 1]
+            if 1 <= choice <= len(FARM_LOCATIONS):
+                location = FARM_LOCATIONS[choice - 1]
             else:
-                print("Invalid selection. Defaulting to a random location.")
-                location_name = random.choice(list(farming_locations.keys()))
+                say("Invalid selection. Defaulting to a random location.")
+                location = RNG.choice(FARM_LOCATIONS)
         except ValueError:
-            print("Invalid input. Defaulting to a random location.")
-            location_name = random.choice(list(farming_locations.keys()))
-        location_data = farming_locations[location_name]
-        print(f"\nYou arrive at {location_name}.")
-        mob_name = location_data['mob_name']
-        enemy_level = max(1, int(self.player.level * location_data['difficulty_multiplier']))
-        if mob_name == "Slime":
-            enemy_health = 30 * enemy_level; enemy_attack = 3 * enemy_level; enemy_defense = 1 * enemy_level; enemy_magic = 1 * enemy_level
-        elif mob_name == "Goblin":
-            enemy_health = 50 * enemy_level; enemy_attack = 5 * enemy_level; enemy_defense = 3 * enemy_level; enemy_magic = 2 * enemy_level
-        elif mob_name == "Shadow Beast":
-            enemy_health = 70 * enemy_level; enemy_attack = 7 * enemy_level; enemy_defense = 4 * enemy_level; enemy_magic = 3 * enemy_level
-        elif mob_name == "Rat":
-            enemy_health = 25 * enemy_level; enemy_attack = 4 * enemy_level; enemy_defense = 1 * enemy_level; enemy_magic = 0 * enemy_level
-        elif mob_name == "Spider":
-            enemy_health = 35 * enemy_level; enemy_attack = 3 * enemy_level; enemy_defense = 2 * enemy_level; enemy_magic = 3 * enemy_level
-        elif mob_name == "Skeleton":
-            enemy_health = 45 * enemy_level; enemy_attack = 6 * enemy_level; enemy_defense = 3 * enemy_level; enemy_magic = 1 * enemy_level
-        elif mob_name == "Dark Mage":
-            enemy_health = 40 * enemy_level; enemy_attack = 2 * enemy_level; enemy_defense = 2 * enemy_level; enemy_magic = 8 * enemy_level
-        elif mob_name == "Stone Golem":
-            enemy_health = 100 * enemy_level; enemy_attack = 4 * enemy_level; enemy_defense = 8 * enemy_level; enemy_magic = 0 * enemy_level
-        elif mob_name == "Harpy":
-            enemy_health = 45 * enemy_level; enemy_attack = 6 * enemy_level; enemy_defense = 2 * enemy_level; enemy_magic = 3 * enemy_level
-        elif mob_name == "Werewolf":
-            enemy_health = 65 * enemy_level; enemy_attack = 8 * enemy_level; enemy_defense = 4 * enemy_level; enemy_magic = 1 * enemy_level
-        elif mob_name == "Dragon Wyrmling":
-            enemy_health = 85 * enemy_level; enemy_attack = 7 * enemy_level; enemy_defense = 6 * enemy_level; enemy_magic = 6 * enemy_level
-        elif mob_name == "Lich":
-            enemy_health = 75 * enemy_level; enemy_attack = 4 * enemy_level; enemy_defense = 5 * enemy_level; enemy_magic = 10 * enemy_level
-        elif mob_name == "Ancient Guardian":
-            enemy_health = 120 * enemy_level; enemy_attack = 6 * enemy_level; enemy_defense = 9 * enemy_level; enemy_magic = 4 * enemy_level
-        else:
-            enemy_health = 40 * enemy_level; enemy_attack = 4 * enemy_level; enemy_defense = 2 * enemy_level; enemy_magic = 2 * enemy_level
-        enemy = create_enemy(mob_name, enemy_health, enemy_attack, enemy_defense, enemy_magic)
-        print(f"A wild {mob_name} (Level {enemy_level}) appears!")
-        print(f"Stats -> HP: {enemy.health}, ATK: {enemy.attack}, DEF: {enemy.defense}, MAG: {enemy.magic_power}")
-        victory = CombatSystem.party_vs_enemies([self.player] + self.player.party, [enemy])
+            say("Invalid input. Defaulting to a random location.")
+            location = RNG.choice(FARM_LOCATIONS)
+        location_name, mob, multiplier, base_exp = location
+        say(f"\nYou arrive at {location_name}.")
+        enemy_level = max(1, int(self.player.level * multiplier))
+        enemy_health, enemy_attack, enemy_defense, enemy_magic = (
+            stat * enemy_level for stat in MOB_BASE_STATS.get(mob, DEFAULT_MOB_STATS))
+        enemy = create_enemy(mob, enemy_health, enemy_attack, enemy_defense, enemy_magic, self.npc_pool)
+        say(f"A wild {mob.label} (Level {enemy_level}) appears!")
+        say(f"Stats -> HP: {enemy.health}, ATK: {enemy.attack}, DEF: {enemy.defense}, MAG: {enemy.magic_power}")
+        victory = CombatSystem.party_vs_enemies(self.player.roster, [enemy])
+        self.npc_pool.release([enemy])
         if victory:
-            print("You defeat the enemy!")
-            exp_reward = int(location_data['base_exp'] * (enemy_level / self.player.level))
+            say("You defeat the enemy!")
+            exp_reward = int(base_exp * (enemy_level / self.player.level))
             exp_reward = max(10, exp_reward)
-            self.player.exp += exp_reward
-            print(f"You gain {exp_reward} experience!")
-            self.player.check_level_up()
+            self._pending_exp += exp_reward
+            say(f"You gain {exp_reward} experience!")
         else:
-            print("You were overwhelmed and had to retreat.")
+            say("You were overwhelmed and had to retreat.")
 
     def travel_explore_dungeon(self):
-        print("\nYou explore a mysterious dungeon filled with dangers and treasures.")
-        enemies = [WorldGenerator.generate_npc() for _ in range(2)]
-        victory = CombatSystem.party_vs_enemies([self.player] + self.player.party, enemies)
+        say("\nYou explore a mysterious dungeon filled with dangers and treasures.")
+        enemies = WorldGenerator.generate_npcs(2, self.npc_pool)
+        victory = CombatSystem.party_vs_enemies(self.player.roster, enemies)
+        self.npc_pool.release(enemies)
         if victory:
-            print("You clear the dungeon and find valuable items!")
-            self.player.exp += random.randint(40, 60)
-            self.player.gold += random.randint(30, 50)
+            say("You clear the dungeon and find valuable items!")
+            exp, gold = RNG.choice(self.DUNGEON_REWARDS)
+            self._pending_exp += exp
+            self.player.gold += gold
             self.player.inventory.append(ItemGenerator.generate_item(self.player.level))
-            if random.random() < 0.5:
+            if RNG.random() < 0.5:
                 potion = Consumable("Health Potion", heal_value=50)
                 self.player.inventory.append(potion)
-                print("You found a Health Potion!")
-            self.player.check_level_up()
+                say("You found a Health Potion!")
         else:
-            print("The dungeon proved too perilous, and you barely escape.")
+            say("The dungeon proved too perilous, and you barely escape.")
 
     def view_stats(self):
-        print("\n" + Fore.CYAN + "=== YOUR STATS ===")
-        print(f"Name: {self.player.name}")
-        print(f"Class: {self.player.char_class}")
-        print(f"Element: {self.player.element.value}")
-        print(f"Alignment: {self.player.alignment.value}")
-        print(f"Level: {self.player.level}")
-        print(f"EXP: {self.player.exp}")
-        required_exp = 100 + (self.player.level - 1) * 20
-        print(f"Next Level in: {required_exp - self.player.exp} EXP")
-        print(f"Gold: {self.player.gold}")
-        print(f"Health: {self.player.health}/{self.player.max_health}")
-        print(f"Attack: {self.player.attack}")
-        print(f"Defense: {self.player.defense}")
-        print(f"Magic: {self.player.magic_power}")
-        print(f"Revives Left: {self.player.revives}")
-        print(f"Party Members: {len(self.player.party)}")
-        print(f"Inventory Items: {len(self.player.inventory)}")
-        if self.player.equipment:
-            print("Equipped Items:")
-            for slot, item in self.player.equipment.items():
-                if item:
-                    print(f"  {slot.capitalize()}: {item.name}")
-                else:
-                    print(f"  {slot.capitalize()}: None")
+        player = self.player
+        required_exp = player.required_exp()
+        lines = [
+            "\n" + Fore.CYAN + "=== YOUR STATS ===" + Style.RESET_ALL,
+            f"Name: {player.name}",
+            f"Class: {player.char_class}",
+            f"Element: {player.element.label}",
+            f"Alignment: {player.alignment.label}",
+            f"Level: {player.level}",
+            f"EXP: {player.exp}",
+            f"Next Level in: {required_exp - player.exp} EXP",
+            f"Gold: {player.gold}",
+            f"Health: {player.health}/{player.max_health}",
+            f"Attack: {player.attack}",
+            f"Defense: {player.defense}",
+            f"Magic: {player.magic_power}",
+            f"Revives Left: {player.revives}",
+            f"Party Members: {len(player.party)}",
+            f"Inventory Items: {len(player.inventory)}",
+        ]
+        if player.equipment:
+            lines.append("Equipped Items:")
+            lines.extend(f"  {slot.capitalize()}: {item.name if item else None}"
+                         for slot, item in player.equipment.items())
+        say("\n".join(lines))
 
 if __name__ == "__main__":
     game = Game()
-    game.splash_screen()
-    game.character_creation()
-    game.main_loop()
+    try:
+        game.splash_screen()
+        game.character_creation()
+        game.main_loop()
+    finally:
+        flush_output()